@@ -0,0 +1,212 @@
+import hashlib
+import os
+import tempfile
+import time
+from .constants import CACHE_EXPIRATION
+
+# Name of the environment variable which, when set, enables the page cache at
+# import time using the value as the cache directory.
+CACHE_DIRECTORY_VARIABLE = "SPORTS_CACHE_DIR"
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "sports")
+
+
+class PageCache:
+    """
+    A persistent, on-disk cache of downloaded HTML pages.
+
+    Every page is stored in a file whose name is the SHA-256 hash of the URL
+    the page was downloaded from, allowing previously-requested pages to be
+    served from the local filesystem instead of being pulled from
+    sports-reference.com again. Pages are either permanent, such as boxscores
+    from a season that has already concluded, or expire after a set amount of
+    time, such as the standings of a season that is still in progress.
+
+    Parameters
+    ----------
+    directory : string
+        The path to the directory where all cached pages should be saved. The
+        directory will be created if it doesn't already exist.
+    expiration : int (optional)
+        The number of seconds a page which is able to change remains valid in
+        the cache before it needs to be pulled again.
+    """
+
+    def __init__(self, directory, expiration=CACHE_EXPIRATION):
+        self._directory = directory
+        self._expiration = expiration
+        os.makedirs(directory, exist_ok=True)
+
+    def __str__(self):
+        """
+        Return the string representation of the class.
+        """
+        return f"Page cache at {self._directory}"
+
+    def __repr__(self):
+        """
+        Return the string representation of the class.
+        """
+        return self.__str__()
+
+    def _path(self, url):
+        """
+        Find the location of a page in the cache.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page.
+
+        Returns
+        -------
+        string
+            Returns a ``string`` of the file path for the requested page. Files
+            are grouped in sub-directories by the first two characters of the
+            hash to avoid placing thousands of files in a single directory.
+        """
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, key[:2], "%s.html" % key)
+
+    def get(self, url, expires=True):
+        """
+        Retrieve a page from the cache.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page.
+        expires : boolean (optional)
+            Set to False if the page can never change, such as a boxscore from
+            a previous season, in which case any cached copy is valid
+            regardless of its age.
+
+        Returns
+        -------
+        string
+            Returns a ``string`` of the page's HTML contents if the page is in
+            the cache and hasn't expired, otherwise returns None.
+        """
+        path = self._path(url)
+        try:
+            if expires and time.time() - os.path.getmtime(path) > self._expiration:
+                return None
+            with open(path, "r", encoding="utf8") as filehandle:
+                return filehandle.read()
+        except OSError:
+            return None
+
+    def set(self, url, contents):
+        """
+        Save a page to the cache.
+
+        The page is first written to a temporary file which then replaces any
+        existing copy of the page, ensuring a partially-written page is never
+        read from the cache.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the page being saved.
+        contents : string
+            A ``string`` of the page's HTML contents.
+        """
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(handle, "w", encoding="utf8") as filehandle:
+                filehandle.write(contents)
+            os.replace(temp_path, path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+    def remove(self, url):
+        """
+        Remove a page from the cache if it exists.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the page to remove.
+        """
+        try:
+            os.remove(self._path(url))
+        except FileNotFoundError:
+            pass
+
+    @property
+    def directory(self):
+        """
+        Returns a ``string`` of the directory where all pages are cached.
+        """
+        return self._directory
+
+    @property
+    def expiration(self):
+        """
+        Returns an ``int`` of the number of seconds a page which is able to
+        change remains valid in the cache.
+        """
+        return self._expiration
+
+
+_page_cache = None
+
+
+def enable_cache(directory=None, expiration=CACHE_EXPIRATION):
+    """
+    Cache every downloaded page on the local filesystem.
+
+    Once enabled, every page requested by any of the leagues is saved to the
+    cache and subsequent requests for the same page are read from the local
+    filesystem instead of being downloaded again until the page expires.
+
+    Parameters
+    ----------
+    directory : string (optional)
+        The path to the directory where all cached pages should be saved.
+        Defaults to the value of the ``SPORTS_CACHE_DIR`` environment variable
+        if set, otherwise '~/.cache/sports'.
+    expiration : int (optional)
+        The number of seconds a page for an ongoing season remains valid
+        before it needs to be pulled again.
+
+    Returns
+    -------
+    PageCache instance
+        Returns the ``PageCache`` instance used for all requests.
+    """
+    global _page_cache
+    if not directory:
+        directory = os.environ.get(CACHE_DIRECTORY_VARIABLE, DEFAULT_CACHE_DIRECTORY)
+    _page_cache = PageCache(directory, expiration)
+    return _page_cache
+
+
+def disable_cache():
+    """
+    Stop caching downloaded pages.
+
+    Any pages which have already been cached are kept on the filesystem and
+    will be used again if the cache is re-enabled for the same directory.
+    """
+    global _page_cache
+    _page_cache = None
+
+
+def get_cache():
+    """
+    Get the page cache used for all requests.
+
+    Returns
+    -------
+    PageCache instance
+        Returns the active ``PageCache`` instance, or None if caching is not
+        enabled.
+    """
+    return _page_cache
+
+
+if os.environ.get(CACHE_DIRECTORY_VARIABLE):
+    enable_cache()
@@ -0,0 +1,180 @@
+import inspect
+import pandas as pd
+import types
+
+
+class SeasonView:
+    """
+    A read-only view of a player's stats for a single season.
+
+    Every property of a player reads the stats of the season at the player's
+    ``_index``. Changing ``_index`` to read another season would affect every
+    other reference to the same player, such as another roster or thread.
+    Properties read through the view use the view's season instead, while
+    every other attribute is read from the player, which is left untouched.
+
+    Parameters
+    ----------
+    player : Player class instance
+        The player whose stats are read.
+    index : int
+        The position of the requested season's stats.
+    """
+
+    def __init__(self, player, index):
+        self._player = player
+        self._index = index
+
+    def __getattr__(self, attribute):
+        # Only called for attributes which aren't set on the view. Properties
+        # and methods are evaluated against the view so they read the view's
+        # season.
+        value = inspect.getattr_static(type(self._player), attribute, None)
+        if isinstance(value, property):
+            return value.fget(self)
+        if isinstance(value, types.FunctionType):
+            return types.MethodType(value, self)
+        return getattr(self._player, attribute)
+
+
+class _ColumnView:
+    """
+    A view of a player whose properties return their value for every
+    requested season at once.
+
+    Parameters
+    ----------
+    player : Player class instance
+        The player whose stats are read.
+    positions : list
+        A ``list`` of the positions of the requested seasons' stats.
+    """
+
+    def __init__(self, player, positions):
+        self._player = player
+        self._positions = positions
+
+    def __getattr__(self, attribute):
+        prop = inspect.getattr_static(type(self._player), attribute)
+        column = getattr(prop.fget, "_season_column", None)
+        if column is not None:
+            return column(self._player, self._positions)
+        # Properties which don't know how to read every season at once are
+        # read for each season through a view instead.
+        return [prop.fget(SeasonView(self._player, p)) for p in self._positions]
+
+
+def season_column(prop, func, value):
+    """
+    Allow a property to be read for every season in a single pass.
+
+    Most properties select a single season's entry from a ``list`` of the raw
+    values for every season, and convert it. Reading the property for every
+    season only needs to get that ``list`` once and convert each entry.
+
+    Parameters
+    ----------
+    prop : property
+        The property created by a decorator, such as
+        ``_int_property_decorator``.
+    func : function
+        The decorated function which returns the raw values for every season.
+    value : function
+        A function which accepts the raw values and the position of a season
+        and returns the converted value for that season, as the property does.
+
+    Returns
+    -------
+    property
+        Returns the requested property.
+    """
+
+    def column(player, positions):
+        values = func(player)
+        return [value(values, position) for position in positions]
+
+    prop.fget._season_column = column
+    return prop
+
+
+def constant_column(prop):
+    """
+    Allow a property which doesn't depend on the season, such as the player's
+    most recent position, to be read for every season in a single pass.
+
+    Parameters
+    ----------
+    prop : property
+        The property created by a decorator, such as
+        ``_most_recent_decorator``.
+
+    Returns
+    -------
+    property
+        Returns the requested property.
+    """
+
+    def column(player, positions):
+        return [prop.fget(player)] * len(positions)
+
+    prop.fget._season_column = column
+    return prop
+
+
+def season_columns(fields, player, positions):
+    """
+    Read the fields included in a player's DataFrame for many seasons at once.
+
+    Parameters
+    ----------
+    fields : function
+        The player's ``_dataframe_fields`` method, which is called with a view
+        of the player whose properties return a ``list`` of their values.
+    player : Player class instance
+        The player whose stats are read.
+    positions : list
+        A ``list`` of the positions of the requested seasons' stats.
+
+    Returns
+    -------
+    dictionary
+        Returns a ``dictionary`` where each key is the name of a field and each
+        value is a ``list`` of the field's value for every requested season.
+    """
+    return fields(_ColumnView(player, positions))
+
+
+def rows_dataframe(rows, index):
+    """
+    Create a single DataFrame from the fields of many objects.
+
+    A DataFrame created directly from a ``list`` of rows converts a column of
+    numbers with any missing values to floats with NaN. Concatenating one
+    single-row DataFrame per object kept those values as they are in an
+    object column instead, which every column with a missing value still does
+    here.
+
+    Parameters
+    ----------
+    rows : list
+        A ``list`` of dictionaries, each returned by an object's
+        ``_dataframe_fields`` method.
+    index : list
+        A ``list`` of the index of each row, such as a team's abbreviation.
+
+    Returns
+    -------
+    Pandas DataFrame
+        Returns a pandas DataFrame where each row is a representation of one
+        object.
+    """
+    columns = {}
+    for field in rows[0] if rows else []:
+        values = [row[field] for row in rows]
+        if any(value is None for value in values):
+            columns[field] = pd.Series(values, dtype=object)
+        else:
+            columns[field] = values
+    frame = pd.DataFrame(columns)
+    frame.index = index
+    return frame
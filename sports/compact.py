@@ -0,0 +1,235 @@
+import sys
+import threading
+
+
+class CompactStore:
+    """
+    Store the parsed fields of many objects in a single table.
+
+    Every parsed object, such as a ``BoxscorePlayer``, keeps each of its
+    fields in its own dictionary, and most fields are additionally wrapped in
+    a single-element list. Holding many thousands of objects in memory is
+    dominated by those dictionaries and lists rather than the values
+    themselves. The store instead keeps the values of every field for all of
+    the objects in a single ``list``, and identical strings, such as '0' or
+    '.500', are only kept once.
+
+    Parameters
+    ----------
+    instances : list
+        A ``list`` of parsed instances of the same class whose fields are
+        stored.
+    """
+
+    def __init__(self, instances):
+        fields = {}
+        for instance in instances:
+            for field in instance.__dict__:
+                fields[field] = None
+        self._single = set()
+        columns = []
+        for field in fields:
+            values = [instance.__dict__.get(field) for instance in instances]
+            # Fields which are a single-element list for every instance only
+            # store the element and are wrapped again when they are read.
+            if all(type(value) == list and len(value) == 1 for value in values):
+                self._single.add(field)
+                values = [value[0] for value in values]
+            columns.append([_intern(value) for value in values])
+        # All values are kept in a single flat list, one row of fields after
+        # another, to avoid the overhead of a separate list for every field.
+        self._offsets = {field: offset for offset, field in enumerate(fields)}
+        self._width = len(fields)
+        self._values = [value for row in zip(*columns) for value in row]
+
+    def get(self, field, row):
+        """
+        Get the value of a field for an instance.
+
+        Parameters
+        ----------
+        field : string
+            The name of the instance's attribute, such as '_points'.
+        row : int
+            The position of the instance in the store.
+
+        Returns
+        -------
+        object
+            Returns the value as it was set on the original instance.
+
+        Raises
+        ------
+        AttributeError
+            If the field wasn't set on any of the stored instances.
+        """
+        try:
+            offset = self._offsets[field]
+        except KeyError:
+            raise AttributeError(field)
+        value = self._values[row * self._width + offset]
+        if field in self._single:
+            return [value]
+        return value
+
+
+def _intern(value):
+    """
+    Share a single copy of identical strings.
+
+    Parameters
+    ----------
+    value : object
+        The value of a field.
+
+    Returns
+    -------
+    object
+        Returns the shared copy of the value if it is a string, otherwise the
+        value is returned as-is.
+    """
+    if type(value) == str:
+        return sys.intern(value)
+    return value
+
+
+def _compact_getattr(self, attribute):
+    # Only called for attributes which aren't defined on the class, which
+    # includes every parsed field as they are read from the store instead.
+    if attribute.startswith("__"):
+        raise AttributeError(attribute)
+    return self._store.get(attribute, self._row)
+
+
+_compact_classes = {}
+_compact_classes_lock = threading.Lock()
+
+
+def _compact_class(cls):
+    """
+    Create the compact version of a class.
+
+    The compact class is a subclass of the original, so every property and
+    method is unchanged, and its instances read every parsed field from the
+    store. As the original class doesn't use slots, the instances still
+    support an instance dictionary, which is what allows an attribute to be
+    set on a single compact object. Declaring the store and position as slots
+    only keeps them out of that dictionary, which on older versions of Python
+    would otherwise be created for every instance; the memory savings come
+    from the store rather than from the instances.
+
+    Parameters
+    ----------
+    cls : class
+        The class of the original instances, such as ``BoxscorePlayer``.
+
+    Returns
+    -------
+    class
+        Returns the compact subclass of the requested class.
+    """
+    with _compact_classes_lock:
+        if cls not in _compact_classes:
+            _compact_classes[cls] = type(
+                cls.__name__,
+                (cls,),
+                {
+                    "__slots__": ("_store", "_row"),
+                    "__getattr__": _compact_getattr,
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                },
+            )
+        return _compact_classes[cls]
+
+
+def compact(instances):
+    """
+    Convert a list of parsed objects to their compact representation.
+
+    The compact objects keep all of the properties and methods of the original
+    objects, such as ``points`` or ``dataframe``, while using a fraction of the
+    memory, which allows many seasons of boxscores to be held in memory at
+    once. The fields of the compact objects are read-only; setting an
+    attribute only affects that object and is no longer stored compactly.
+
+    Parameters
+    ----------
+    instances : list
+        A ``list`` of parsed instances of the same class, such as the
+        ``BoxscorePlayer`` instances of a boxscore.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of the compact objects in the same order as the
+        original objects.
+    """
+    if not instances:
+        return instances
+    instances = list(instances)
+    store = CompactStore(instances)
+    compact_class = _compact_class(type(instances[0]))
+    compacted = []
+    for row in range(len(instances)):
+        instance = object.__new__(compact_class)
+        instance._store = store
+        instance._row = row
+        compacted.append(instance)
+    return compacted
+
+
+_enabled = False
+
+
+def enable():
+    """
+    Store all subsequently parsed objects compactly.
+
+    Once enabled, the players of every ``Boxscore``, the games of every
+    ``Schedule``, and the teams of every ``Teams`` instance are converted to
+    their compact representation as soon as they are parsed.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+    Stop storing parsed objects compactly.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """
+    Determine whether parsed objects are stored compactly.
+
+    Returns
+    -------
+    boolean
+        Returns True if compact storage has been enabled.
+    """
+    return _enabled
+
+
+def compact_if_enabled(instances):
+    """
+    Convert a list of parsed objects to their compact representation if
+    compact storage has been enabled.
+
+    Parameters
+    ----------
+    instances : list
+        A ``list`` of parsed instances of the same class.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of the compact objects if compact storage is
+        enabled, otherwise the original ``list`` is returned.
+    """
+    if not _enabled:
+        return instances
+    return compact(instances)
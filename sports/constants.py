@@ -10,3 +10,32 @@ POST_SEASON = "Post"
 CONFERENCE_TOURNAMENT = "Conf-Tourney"
 NON_DI = "Non-DI School"
 REQUESTS_PER_MINUTE = 15
+CACHE_EXPIRATION = 6 * 60 * 60
+# The number of requests which can be sent back-to-back before being limited to
+# REQUESTS_PER_MINUTE. Combined with the sustained rate, no more than 20
+# requests are sent to a single site in any one minute.
+REQUESTS_BURST = 5
+# The number of seconds to wait to connect to a site and then to receive the
+# page before the request is abandoned.
+REQUEST_TIMEOUT = (10, 60)
+# The number of times a request which failed due to a server error (5xx), was
+# rate limited (429), or was dropped mid-response is retried. The wait between
+# retries doubles each time, growing by a factor of REQUEST_BACKOFF seconds,
+# unless the site requests a specific wait with a 'Retry-After' header. No
+# single wait is longer than REQUEST_MAX_BACKOFF seconds.
+REQUEST_RETRIES = 3
+REQUEST_BACKOFF = 2
+REQUEST_MAX_BACKOFF = 60
+# The number of parsed boxscores kept in memory so every game referencing the
+# same boxscore shares a single instance. The least recently used boxscores are
+# dropped once the limit is reached.
+BOXSCORE_REGISTRY_SIZE = 500
+# The number of parsed players kept in memory so a player listed on multiple
+# rosters, such as after a trade or across several seasons of the same team,
+# only has their page downloaded once. The least recently used players are
+# dropped once the limit is reached.
+PLAYER_REGISTRY_SIZE = 2000
+# The number of distinct raw values whose converted int or float value is kept
+# by the property decorators, so repeatedly reading a property doesn't convert
+# the same string again.
+CONVERSION_CACHE_SIZE = 65536
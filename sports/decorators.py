@@ -1,28 +1,87 @@
-from functools import wraps
+from functools import lru_cache, wraps
+from .constants import CONVERSION_CACHE_SIZE
+
+
+def cached_conversion(func):
+    """
+    Remember the result of converting a raw value to a number.
+
+    Every numeric property returns the raw string parsed from the page, which
+    is cleaned up and converted each time the property is read. As the
+    conversion only depends on the raw value, the result for every distinct
+    value is kept and shared between all instances, so reading a property
+    repeatedly, or reading the same value from different players or teams,
+    only converts it once. Values which can't be hashed, such as lists, are
+    converted without being kept.
+
+    Parameters
+    ----------
+    func : callable
+        A function which takes a single raw value and returns the converted
+        value. The function shouldn't raise an exception for values which
+        can't be converted and should return a default instead.
+
+    Returns
+    -------
+    callable
+        Returns the function wrapped with the conversion cache.
+    """
+    cached = lru_cache(maxsize=CONVERSION_CACHE_SIZE)(func)
+
+    @wraps(func)
+    def wrapper(value):
+        try:
+            return cached(value)
+        except TypeError:
+            return func(value)
+
+    return wrapper
+
+
+@cached_conversion
+def _int_value(value):
+    try:
+        if type(value) == str:
+            # fbref started providing ages in the format %y-%d
+            # if "-" in string grab just the first number to get
+            # age in years
+            return int(value.replace("+", "").split("-")[0])
+        else:
+            return int(value)
+    except (TypeError, ValueError):
+        # If there is no value, default to None. None is statistically
+        # different from 0 as a player/team who played an entire game and
+        # contributed nothing is different from one who didn't play at all.
+        # This enables flexibility for end-users to decide whether they
+        # want to fill the empty value with any specific number (such as 0
+        # or an average/median for the category) or keep it empty depending
+        # on their use-case.
+        return None
+
+
+@cached_conversion
+def _float_value(value):
+    try:
+        if type(value) == str:
+            return float(value.replace("%", ""))
+        else:
+            return float(value)
+    except (TypeError, ValueError) as e:
+        # If there is no value, default to None. None is statistically
+        # different from 0 as a player/team who played an entire game and
+        # contributed nothing is different from one who didn't play at all.
+        # This enables flexibility for end-users to decide whether they
+        # want to fill the empty value with any specific number (such as 0
+        # or an average/median for the category) or keep it empty depending
+        # on their use-case.
+        return None
 
 
 def int_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        value = func(*args)
-        try:
-            if type(value) == str:
-                # fbref started providing ages in the format %y-%d
-                # if "-" in string grab just the first number to get
-                # age in years
-                return int(value.replace("+", "").split("-")[0])
-            else:
-                return int(value)
-        except (TypeError, ValueError):
-            # If there is no value, default to None. None is statistically
-            # different from 0 as a player/team who played an entire game and
-            # contributed nothing is different from one who didn't play at all.
-            # This enables flexibility for end-users to decide whether they
-            # want to fill the empty value with any specific number (such as 0
-            # or an average/median for the category) or keep it empty depending
-            # on their use-case.
-            return None
+        return _int_value(func(*args))
 
     return wrapper
 
@@ -31,20 +90,6 @@ def float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
-        value = func(*args)
-        try:
-            if type(value) == str:
-                return float(value.replace("%", ""))
-            else:
-                return float(value)
-        except (TypeError, ValueError) as e:
-            # If there is no value, default to None. None is statistically
-            # different from 0 as a player/team who played an entire game and
-            # contributed nothing is different from one who didn't play at all.
-            # This enables flexibility for end-users to decide whether they
-            # want to fill the empty value with any specific number (such as 0
-            # or an average/median for the category) or keep it empty depending
-            # on their use-case.
-            return None
+        return _float_value(func(*args))
 
     return wrapper
@@ -1,5 +1,11 @@
 SQUAD_URL = "https://fbref.com/en/squads/%s"
 
+# The number of teams sharing the most trigrams with a requested name which
+# are compared first when suggesting the closest matches for an unknown team.
+# Their similarity sets the bar every other team needs to be able to clear to
+# be compared at all.
+FUZZY_MATCH_CANDIDATES = 20
+
 SCHEDULE_SCHEME = {
     "date": 'th[data-stat="date"]',
     "competition": 'td[data-stat="comp"]',
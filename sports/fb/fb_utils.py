@@ -1,4 +1,9 @@
-from difflib import get_close_matches
+import heapq
+import unicodedata
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from .constants import FUZZY_MATCH_CANDIDATES
 from .squad_ids import SQUAD_IDS
 
 
@@ -27,6 +32,181 @@ def _parse_squad_name(team_id):
     return name
 
 
+def _normalize_squad_name(name):
+    """
+    Reduce a parsed team name to a form which ignores accents and spacing.
+
+    Parameters
+    ----------
+    name : string
+        The team's name as returned by ``_parse_squad_name``.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the name without any accents and with all
+        whitespace collapsed to single spaces, such as 'kf skenderbeu korce'
+        for 'kf skënderbeu korçë'.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.split())
+
+
+def _trigrams(name):
+    """
+    Split a name into every sequence of three consecutive characters.
+
+    The name is padded with spaces so the start and end of the name, along
+    with names shorter than three characters, are also included.
+
+    Parameters
+    ----------
+    name : string
+        The team's name to split.
+
+    Returns
+    -------
+    set
+        Returns a ``set`` of every three-character string in the name.
+    """
+    padded = "  %s " % name
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+@lru_cache(maxsize=None)
+def _squad_index():
+    """
+    Build the lookup index for the master squad ID list.
+
+    The index is only built the first time a team is looked up and is shared
+    by every subsequent lookup.
+
+    Returns
+    -------
+    tuple
+        Returns a ``tuple`` of a ``frozenset`` of every squad ID, a
+        ``dictionary`` of each normalized name to the name in the master list,
+        a ``dictionary`` of each trigram to the ``list`` of names which contain
+        it, and a ``dictionary`` of each character to a ``list`` where the
+        list at position N holds the names containing the character at least
+        N + 1 times.
+    """
+    squad_ids = frozenset(SQUAD_IDS.values())
+    normalized_names = {}
+    trigrams = {}
+    characters = {}
+    for name in SQUAD_IDS:
+        normalized_names.setdefault(_normalize_squad_name(name), name)
+        for trigram in _trigrams(name):
+            trigrams.setdefault(trigram, []).append(name)
+        for character, count in Counter(name).items():
+            names = characters.setdefault(character, [])
+            while len(names) < count:
+                names.append([])
+            for position in range(count):
+                names[position].append(name)
+    return squad_ids, normalized_names, trigrams, characters
+
+
+def _fuzzy_candidates(name):
+    """
+    Find the names in the master list which are most likely similar to a name.
+
+    Parameters
+    ----------
+    name : string
+        The parsed team name to find candidates for.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of the FUZZY_MATCH_CANDIDATES names in the master
+        list with the most trigrams in common with the requested name.
+    """
+    _, _, trigrams, _ = _squad_index()
+    counts = {}
+    for trigram in _trigrams(name):
+        for candidate in trigrams.get(trigram, []):
+            counts[candidate] = counts.get(candidate, 0) + 1
+    return sorted(counts, key=counts.get, reverse=True)[:FUZZY_MATCH_CANDIDATES]
+
+
+def _shared_characters(name):
+    """
+    Count the characters each name in the master list has in common with a
+    name.
+
+    Parameters
+    ----------
+    name : string
+        The parsed team name to compare.
+
+    Returns
+    -------
+    Counter
+        Returns a ``Counter`` of each name in the master list sharing at least
+        one character with the requested name and the number of characters
+        they share, counting repeated characters as often as both names
+        contain them.
+    """
+    _, _, _, characters = _squad_index()
+    shared = Counter()
+    for character, count in Counter(name).items():
+        for names in characters.get(character, [])[:count]:
+            shared.update(names)
+    return shared
+
+
+def _closest_squad_names(name, n=5, cutoff=0.6):
+    """
+    Find the names in the master list which are closest to a name.
+
+    Returns the same matches, in the same order, as
+    ``difflib.get_close_matches`` comparing the name against every team in
+    the master list, without calculating the similarity of every team.
+
+    The similarity of two names can't be higher than the number of characters
+    they share relative to their combined length. The teams sharing the most
+    trigrams with the name are compared first, and the Nth highest similarity
+    among them becomes the bar every other team needs to clear. Only teams
+    which share enough characters with the name to possibly clear that bar
+    are compared.
+
+    Parameters
+    ----------
+    name : string
+        The parsed team name to find matches for.
+    n : int (optional)
+        The maximum number of matches to return.
+    cutoff : float (optional)
+        The minimum similarity between 0 and 1 of a match.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of up to ``n`` names in the master list which are
+        closest to the requested name, with the closest first.
+    """
+    matcher = SequenceMatcher()
+    matcher.set_seq2(name)
+    scores = {}
+    for candidate in _fuzzy_candidates(name):
+        matcher.set_seq1(candidate)
+        scores[candidate] = matcher.ratio()
+    best = heapq.nlargest(n, scores.values())
+    minimum = max(cutoff, best[-1]) if len(best) == n else cutoff
+    for candidate, shared in _shared_characters(name).items():
+        # Calculated the same way as SequenceMatcher.quick_ratio, which is
+        # never lower than the actual similarity.
+        if candidate in scores or 2.0 * shared / (len(candidate) + len(name)) < minimum:
+            continue
+        matcher.set_seq1(candidate)
+        scores[candidate] = matcher.ratio()
+    matches = [(score, team) for team, score in scores.items() if score >= cutoff]
+    return [team for _, team in heapq.nlargest(n, matches)]
+
+
 def lookup_squad_id(name, quiet=False):
     """
     Attempt to match a team name with a squad ID.
@@ -82,7 +262,11 @@ def lookup_squad_id(name, quiet=False):
     filtered_name = _parse_squad_name(name)
     if filtered_name in SQUAD_IDS:
         return SQUAD_IDS[filtered_name]
-    closest_matches = get_close_matches(filtered_name, SQUAD_IDS.keys(), 5)
+    _, normalized_names, _, _ = _squad_index()
+    normalized_name = _normalize_squad_name(filtered_name)
+    if normalized_name in normalized_names:
+        return SQUAD_IDS[normalized_names[normalized_name]]
+    closest_matches = _closest_squad_names(filtered_name, 5)
     squad_match_ids = {}
     output = "Exact match not found - Printing closest matches:\n"
     print(closest_matches)
@@ -117,7 +301,8 @@ def _lookup_team(team_id):
     string
         Returns a ``string`` of the squad's 8-digit ID.
     """
-    if team_id.lower() in SQUAD_IDS.values():
+    squad_ids, _, _, _ = _squad_index()
+    if team_id.lower() in squad_ids:
         return team_id.lower()
     name = lookup_squad_id(team_id)
     if type(name) == str:
@@ -4,13 +4,12 @@ from .constants import ROSTER_SCHEME, SQUAD_URL
 from ..decorators import float_property_decorator, int_property_decorator
 from .fb_utils import _lookup_team
 from .league_ids import LEAGUE_IDS
-from pyquery import PyQuery as pq
 from sports import utils
 from sports.utils import (
     _get_stats_table,
     _parse_field,
-    _remove_html_comment_tags,
     _rate_limit_pq,
+    _uncommented_page,
 )
 from urllib.error import HTTPError
 
@@ -1484,6 +1483,7 @@ class Roster:
         if not player_data_dict:
             return None
         self._instantiate_players(player_data_dict)
+        self._index_players()
 
     def __call__(self, player):
         """
@@ -1511,15 +1511,34 @@ class Roster:
             If the requested player cannot be matched with a player in the
             squad.
         """
-        for player_instance in self._players:
-            if not player_instance.name or not player_instance.player_id:
-                continue  # pragma: no cover
-            if player.lower() == player_instance.player_id.lower():
-                return player_instance
-            if player.lower().strip() == player_instance.name.lower().strip():
-                return player_instance
+        # The index is rebuilt if the list of players has been replaced since
+        # it was last built, or if the roster didn't have any players to index
+        # when it was created.
+        if getattr(self, "_indexed_players", None) is not self._players:
+            self._index_players()
+        if player.lower() in self._player_ids:
+            return self._player_ids[player.lower()]
+        if player.lower().strip() in self._player_names:
+            return self._player_names[player.lower().strip()]
         raise ValueError("No player found with the requested name or ID")
 
+    def _index_players(self):
+        """
+        Index every player by their player ID and name.
+
+        Requesting a player is a single lookup in the index instead of
+        comparing the ID and name of every player on the roster. Players
+        without both a name and an ID can't be requested.
+        """
+        self._player_ids = {}
+        self._player_names = {}
+        for player in self._players:
+            if not player.name or not player.player_id:
+                continue
+            self._player_ids.setdefault(player.player_id.lower(), player)
+            self._player_names.setdefault(player.name.lower().strip(), player)
+        self._indexed_players = self._players
+
     def __str__(self):
         """
         Return the string representation of the class.
@@ -1632,7 +1651,7 @@ class Roster:
         if not doc:
             try:
                 doc = utils._rate_limit_pq(SQUAD_URL % self._squad_id)
-                doc = pq(_remove_html_comment_tags(doc))
+                doc = _uncommented_page(doc)
             except HTTPError:
                 return None
         stats_table = []
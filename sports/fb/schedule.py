@@ -2,6 +2,7 @@ import pandas as pd
 import re
 from .constants import SCHEDULE_SCHEME, SQUAD_URL
 from datetime import datetime
+from ..compact import compact_if_enabled
 from ..decorators import float_property_decorator, int_property_decorator
 from .fb_utils import _lookup_team
 from pyquery import PyQuery as pq
@@ -480,7 +481,9 @@ class Schedule:
 
     def __init__(self, team_id, doc=None):
         self._games = []
+        self._dates = None
         self._pull_schedule(team_id, doc)
+        self._games = compact_if_enabled(self._games)
 
     def __getitem__(self, index):
         """
@@ -507,6 +510,32 @@ class Schedule:
         """
         return self._games[index]
 
+    def _date_index(self):
+        """
+        Group the games in the schedule by the day they were played.
+
+        The index is built the first time a game is requested by date and is
+        reused for every subsequent request, so finding a game doesn't require
+        checking the date of every game in the schedule.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` where each key is a ``tuple`` of the year,
+            month, and day and each value is a ``list`` of the Game instances
+            played on that day in schedule order.
+        """
+        if self._dates is None:
+            dates = {}
+            for game in self._games:
+                game_datetime = game.datetime
+                if not game_datetime:
+                    continue  # pragma: no cover
+                day = (game_datetime.year, game_datetime.month, game_datetime.day)
+                dates.setdefault(day, []).append(game)
+            self._dates = dates
+        return self._dates
+
     def __call__(self, date):
         """
         Return a specified game.
@@ -532,16 +561,36 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if not game.datetime:
-                continue  # pragma: no cover
-            if (
-                game.datetime.year == date.year
-                and game.datetime.month == date.month
-                and game.datetime.day == date.day
-            ):
-                return game
-        raise ValueError("No games found for requested date")
+        games = self._date_index().get((date.year, date.month, date.day))
+        if not games:
+            raise ValueError("No games found for requested date")
+        return games[0]
+
+    def games_between(self, start_date, end_date):
+        """
+        Return every game played within a range of dates.
+
+        Parameters
+        ----------
+        start_date : datetime
+            A datetime object of the first day to include. Any time of day is
+            ignored.
+        end_date : datetime
+            A datetime object of the last day to include. Any time of day is
+            ignored.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of the Game instances played between both dates,
+            inclusive, in the order they were played.
+        """
+        dates = self._date_index()
+        start = (start_date.year, start_date.month, start_date.day)
+        end = (end_date.year, end_date.month, end_date.day)
+        return [
+            game for day in sorted(dates) if start <= day <= end for game in dates[day]
+        ]
 
     def __str__(self):
         """
@@ -0,0 +1,133 @@
+import threading
+from .scheduler import get_scheduler
+
+
+class LazyPlayer:
+    """
+    A placeholder for a player whose stats haven't been downloaded yet.
+
+    Creating a ``Player`` downloads and parses the player's page, which is
+    wasteful when only a handful of players on a roster are needed. A
+    ``LazyPlayer`` only holds the player's ID and the name listed on the
+    roster, and creates the underlying ``Player`` the first time any other
+    attribute is requested. After that, every attribute and call is passed
+    through to the ``Player``, so the placeholder can be used anywhere a
+    ``Player`` is expected.
+
+    Parameters
+    ----------
+    player_class : class
+        The league's ``Player`` class which is created with the player ID.
+    player_id : string
+        The player's ID as used in the URL of their page.
+    name : string
+        The player's name as listed on the roster.
+    url : string
+        The URL of a page on the same site as the player's page, which is used
+        to schedule the download alongside other requests to the site.
+    """
+
+    def __init__(self, player_class, player_id, name, url):
+        self._player_class = player_class
+        self._player_id = player_id
+        self._name = name
+        self._url = url
+        self._player = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attribute):
+        # Only called for attributes which aren't set on the placeholder. Any
+        # special attributes, such as those checked while copying, shouldn't
+        # trigger a download.
+        if attribute.startswith("__"):
+            raise AttributeError(attribute)
+        return getattr(self._load(), attribute)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __str__(self):
+        """
+        Return the string representation of the class.
+        """
+        if self._player is not None:
+            return str(self._player)
+        return f"{self._name} ({self._player_id})"
+
+    def __repr__(self):
+        """
+        Return the string representation of the class.
+        """
+        return self.__str__()
+
+    def _load(self):
+        """
+        Create the underlying ``Player`` if it doesn't exist yet.
+
+        Returns
+        -------
+        Player class instance
+            Returns the ``Player`` instance for the player.
+        """
+        with self._lock:
+            if self._player is None:
+                self._player = self._player_class(self._player_id)
+            return self._player
+
+    @property
+    def loaded(self):
+        """
+        Returns a ``boolean`` which is True when the player's page has been
+        downloaded and parsed.
+        """
+        return self._player is not None
+
+    @property
+    def player_id(self):
+        """
+        Returns a ``string`` of the player's ID, such as 'hardeja01' for James
+        Harden.
+        """
+        return self._player_id
+
+    @property
+    def name(self):
+        """
+        Returns a ``string`` of the player's name as listed on the roster, such
+        as 'James Harden'.
+        """
+        return self._name
+
+
+def materialize(players):
+    """
+    Download the pages for a batch of players concurrently.
+
+    Every ``LazyPlayer`` which hasn't been loaded yet has its ``Player``
+    created by the shared scheduler so the pages are downloaded in parallel.
+    Any other items, such as ``Player`` instances, are returned as-is.
+
+    Parameters
+    ----------
+    players : list
+        A ``list`` of ``LazyPlayer`` or ``Player`` instances.
+
+    Returns
+    -------
+    list
+        Returns a ``list`` of ``Player`` instances in the same order as the
+        requested players.
+    """
+    pending = [
+        player
+        for player in players
+        if isinstance(player, LazyPlayer) and not player.loaded
+    ]
+    if pending:
+        get_scheduler().map(
+            LazyPlayer._load, pending, [player._url for player in pending]
+        )
+    return [
+        player._load() if isinstance(player, LazyPlayer) else player
+        for player in players
+    ]
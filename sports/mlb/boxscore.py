@@ -1,11 +1,12 @@
 import pandas as pd
 import re
 from datetime import timedelta
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import registry, utils
+from ..compact import compact_if_enabled
 from ..constants import AWAY, HOME
 from ..decorators import float_property_decorator, int_property_decorator
+from ..scheduler import get_scheduler
 from .constants import (
     BOXSCORE_ELEMENT_INDEX,
     BOXSCORE_SCHEME,
@@ -49,10 +50,10 @@ class BoxscorePlayer(AbstractPlayer):
     player_name : string
         A string representing the player's first and last name, such as 'Jose
         Altuve'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : PyQuery object
+        A PyQuery object of the player's table rows from the Boxscore page.
+        If the player appears in multiple tables, the rows from every table
+        are combined into the single object.
     """
 
     def __init__(self, player_id, player_name, player_data):
@@ -473,7 +474,7 @@ class Boxscore:
             print("HTTP Error")
             print(e)
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._uncommented_page(url_data)
 
     def _parse_game_date_and_location(self, boxscore):
         """
@@ -697,11 +698,11 @@ class Boxscore:
                 continue
             name = self._find_player_name(row)
             try:
-                player_dict[player_id]["data"] += str(row).strip()
+                player_dict[player_id]["data"] += row
             except KeyError:
                 player_dict[player_id] = {
                     "name": name,
-                    "data": str(row).strip(),
+                    "data": row,
                     "team": home_or_away,
                 }
         return player_dict
@@ -834,6 +835,8 @@ class Boxscore:
             setattr(self, field, value)
         self._parse_game_date_and_location(boxscore)
         self._away_players, self._home_players = self._find_players(boxscore)
+        self._away_players = compact_if_enabled(self._away_players)
+        self._home_players = compact_if_enabled(self._home_players)
 
     @property
     def dataframe(self):
@@ -1683,6 +1686,77 @@ class Boxscores:
         """
         return self._boxscores
 
+    @classmethod
+    def iter_games(cls, date, end_date=None):
+        """
+        Search for games, yielding each day's games as soon as they are found.
+
+        Unlike creating a ``Boxscores`` instance, which only returns once
+        every requested day has been pulled, the games for each day are
+        yielded as soon as the day's page is downloaded and parsed. Days are
+        yielded in the order they complete, which isn't necessarily the order
+        they were played in.
+
+        Parameters
+        ----------
+        date : datetime object
+            The date to search for any matches. The month, day, and year are
+            required for the search, but time is not factored into the search.
+        end_date : datetime object (optional)
+            Optionally specify an end date to iterate until. If left empty, or
+            if 'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be pulled.
+
+        Yields
+        ------
+        tuple
+            Yields a ``tuple`` of the day's string date in the format
+            'MM-DD-YYYY' and a ``list`` of the games played on that day in the
+            same format as the values of the ``games`` property.
+        """
+        # The search doesn't store anything on the instance, so it's created
+        # without pulling any days up front.
+        boxscores = cls.__new__(cls)
+        boxscores._boxscores = {}
+        dates = boxscores._requested_dates(date, end_date)
+        yield from boxscores._stream_games(dates)
+
+    @classmethod
+    def iter_boxscores(cls, date, end_date=None):
+        """
+        Search for games, yielding the ``Boxscore`` of every game as soon as
+        it is parsed.
+
+        The boxscores for each day are requested as soon as the day's games
+        are found and are yielded in the order they complete, which allows
+        every game to be processed and discarded without holding the entire
+        range in memory.
+
+        Parameters
+        ----------
+        date : datetime object
+            The date to search for any matches. The month, day, and year are
+            required for the search, but time is not factored into the search.
+        end_date : datetime object (optional)
+            Optionally specify an end date to iterate until. If left empty, or
+            if 'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be pulled.
+
+        Yields
+        ------
+        Boxscore class instance
+            Yields the ``Boxscore`` of every game which has been played.
+        """
+        scheduler = get_scheduler()
+        for _, games in cls.iter_games(date, end_date):
+            uris = [game["boxscore"] for game in games if game["boxscore"]]
+            for _, boxscore in scheduler.as_completed(
+                lambda uri: registry.get_boxscore("mlb", uri, Boxscore),
+                uris,
+                BOXSCORE_URL,
+            ):
+                yield boxscore
+
     def _create_url(self, date):
         """
         Build the URL based on the passed datetime object.
@@ -1942,6 +2016,81 @@ class Boxscores:
             all_boxscores.append(game_info)
         return all_boxscores
 
+    def _requested_dates(self, date, end_date):
+        """
+        Expand the requested range into every individual day.
+
+        Parameters
+        ----------
+        date : datetime object
+            The first day to search for any matches.
+        end_date : datetime object
+            Optionally specify the last day to search for any matches. If left
+            empty, or if 'end_date' is prior to 'date', only the day specified
+            in the 'date' parameter is included.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of datetime objects for every requested day in
+            date order.
+        """
+        # Set the end date to the start date if the end date is before the
+        # start date.
+        if not end_date or date > end_date:
+            end_date = date
+        dates = []
+        date_step = date
+        while date_step <= end_date:
+            dates.append(date_step)
+            date_step += timedelta(days=1)
+        return dates
+
+    def _find_day_games(self, date):
+        """
+        Retrieve all games played on a single day.
+
+        Parameters
+        ----------
+        date : datetime object
+            The date to search for any matches.
+
+        Returns
+        -------
+        tuple
+            Returns a ``tuple`` of the day's string date in the format
+            'MM-DD-YYYY' and a ``list`` of the games played on that day.
+        """
+        page = self._get_requested_page(self._create_url(date))
+        games = page('table[class="teams"]').items()
+        timestamp = "%s-%s-%s" % (date.month, date.day, date.year)
+        return timestamp, self._extract_game_info(games)
+
+    def _stream_games(self, dates):
+        """
+        Retrieve the games for every requested day as each day completes.
+
+        The pages for all days are downloaded and parsed concurrently by the
+        shared scheduler, which keeps the requests within the site's rate
+        limit and reads any cached pages instead of downloading them again.
+
+        Parameters
+        ----------
+        dates : list
+            A ``list`` of datetime objects for every day to search.
+
+        Yields
+        ------
+        tuple
+            Yields a ``tuple`` of the day's string date in the format
+            'MM-DD-YYYY' and a ``list`` of the games played on that day, in
+            the order the days complete.
+        """
+        urls = [self._create_url(date) for date in dates]
+        scheduler = get_scheduler()
+        for _, day_games in scheduler.as_completed(self._find_day_games, dates, urls):
+            yield day_games
+
     def _find_games(self, date, end_date):
         """
         Retrieve all major games played on a given day.
@@ -1965,16 +2114,10 @@ class Boxscores:
             the games from the day specified in the 'date' parameter will be
             saved.
         """
-        # Set the end date to the start date if the end date is before the
-        # start date.
-        if not end_date or date > end_date:
-            end_date = date
-        date_step = date
-        while date_step <= end_date:
-            url = self._create_url(date_step)
-            page = self._get_requested_page(url)
-            games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
+        dates = self._requested_dates(date, end_date)
+        # Every day is downloaded and parsed concurrently, so the days can
+        # finish in any order and are saved in date order once all are done.
+        day_games = dict(self._stream_games(dates))
+        for date_step in dates:
             timestamp = "%s-%s-%s" % (date_step.month, date_step.day, date_step.year)
-            self._boxscores[timestamp] = boxscores
-            date_step += timedelta(days=1)
+            self._boxscores[timestamp] = day_games[timestamp]
@@ -68,16 +68,14 @@ def _retrieve_all_teams(year, standings_file=None, teams_file=None):
     """
     team_data_dict = {}
 
+    doc = None
     if not year:
-        year = utils._find_year_for_season("mlb")
         # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(STANDINGS_URL % year) and utils._url_exists(
-            STANDINGS_URL % str(int(year) - 1)
-        ):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(STANDINGS_URL % year, standings_file)
+        # right before a new season begins), the previous year's stats are
+        # pulled instead.
+        year, doc = utils._resolve_season("mlb", lambda season: STANDINGS_URL % season)
+    if doc is None or standings_file:
+        doc = utils._pull_page(STANDINGS_URL % year, standings_file)
     div_prefix = "div#all_expanded_standings_overall"
     standings = utils._get_stats_table(doc, div_prefix)
     doc = utils._pull_page(TEAM_STATS_URL % year, teams_file)
@@ -5,6 +5,7 @@ from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
+from ..decorators import cached_conversion
 from .constants import (
     BOXSCORE_SCHEME,
     NATIONALITY,
@@ -27,6 +28,22 @@ def _cleanup(prop):
         return ""
 
 
+@cached_conversion
+def _int_value(value):
+    try:
+        return int(_cleanup(value))
+    except ValueError:
+        return None
+
+
+@cached_conversion
+def _float_value(value):
+    try:
+        return float(_cleanup(value))
+    except ValueError:
+        return None
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
@@ -37,8 +54,8 @@ def _int_property_decorator(func):
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
         try:
-            value = _cleanup(prop[index][element_ind])
-            return int(value)
+            value = prop[index][element_ind]
+            return _int_value(value)
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
@@ -56,8 +73,8 @@ def _float_property_decorator(func):
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
         try:
-            value = _cleanup(prop[index][element_ind])
-            return float(value)
+            value = prop[index][element_ind]
+            return _float_value(value)
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
@@ -156,14 +173,20 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or PyQuery object
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
+            season and each value contains a PyQuery object of the season's
+            table rows. If this class is inherited from the ``BoxscorePlayer``
+            class, player_data will be a PyQuery object of the player's rows
+            in the boxscore.
+        """
+        # Create the PyQuery object for every season a single time up front so
+        # it can be shared while extracting each of the fields.
+        if type(player_data) == dict:
+            seasons = [pq(data["data"]) for data in player_data.values()]
+        else:
+            seasons = [pq(player_data)]
         for field in self.__dict__:
             short_field = str(field)[1:]
             if (
@@ -179,16 +202,7 @@ class AbstractPlayer:
                 or short_field == "contract"
             ):
                 continue
-            field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data["data"])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
-                value = self._parse_value(stats, short_field)
-                field_stats.append(value)
+            field_stats = [self._parse_value(stats, short_field) for stats in seasons]
             setattr(self, field, field_stats)
 
     @property
@@ -1,7 +1,6 @@
 from .constants import PARSING_SCHEME, SEASON_PAGE_URL
 from pyquery import PyQuery as pq
 from sports import utils
-from urllib.error import HTTPError
 
 
 def _add_stats_data(teams_list, team_data_dict):
@@ -64,25 +63,16 @@ def _retrieve_all_teams(year, season_file=None):
     """
     team_data_dict = {}
 
+    doc = None
     if not year:
-        year = utils._find_year_for_season("nba")
-        # Given the delays to the NBA season in 2020, the default season
-        # selection logic is no longer valid after the original season should
-        # have concluded. In this case, the previous season should be pulled
-        # instead.
-        if year == 2021:
-            try:
-                doc = utils._rate_limit_pq(SEASON_PAGE_URL % year)
-            except HTTPError:
-                year = str(int(year) - 1)
         # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(SEASON_PAGE_URL % year) and utils._url_exists(
-            SEASON_PAGE_URL % str(int(year) - 1)
-        ):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_file)
+        # right before a new season begins), the previous year's stats are
+        # pulled instead.
+        year, doc = utils._resolve_season(
+            "nba", lambda season: SEASON_PAGE_URL % season
+        )
+    if doc is None or season_file:
+        doc = utils._pull_page(SEASON_PAGE_URL % year, season_file)
     teams_list = utils._get_stats_table(doc, "div#div_totals-team")
     opp_teams_list = utils._get_stats_table(doc, "div#div_totals-opponent")
 
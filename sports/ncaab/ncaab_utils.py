@@ -80,16 +80,16 @@ def _retrieve_all_teams(
     """
     team_data_dict = {}
 
+    doc = None
     if not year:
-        year = utils._find_year_for_season("ncaab")
         # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(BASIC_STATS_URL % year) and utils._url_exists(
-            BASIC_STATS_URL % str(int(year) - 1)
-        ):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(BASIC_STATS_URL % year, basic_stats)
+        # right before a new season begins), the previous year's stats are
+        # pulled instead.
+        year, doc = utils._resolve_season(
+            "ncaab", lambda season: BASIC_STATS_URL % season
+        )
+    if doc is None or basic_stats:
+        doc = utils._pull_page(BASIC_STATS_URL % year, basic_stats)
     teams_list = utils._get_stats_table(doc, "table#basic_school_stats")
     doc = utils._pull_page(ADVANCED_STATS_URL % year, adv_stats)
     adv_teams_list = utils._get_stats_table(doc, "table#adv_school_stats")
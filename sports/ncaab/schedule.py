@@ -1,7 +1,12 @@
 import pandas as pd
 import re
+from ..columns import rows_dataframe
+from ..compact import compact_if_enabled
 from ..decorators import int_property_decorator
+from .. import registry
+from ..scheduler import get_scheduler
 from .constants import (
+    BOXSCORE_URL,
     SCHEDULE_SCHEME,
     SCHEDULE_URL,
     NCAA_TOURNAMENT,
@@ -60,6 +65,9 @@ class Game:
         self._arena = None
 
         self._parse_game_data(game_data)
+        # Set once the fields are parsed as the boxscore isn't part of the
+        # schedule table.
+        self._boxscore_instance = None
 
     def __str__(self):
         """
@@ -149,11 +157,16 @@ class Game:
             value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
             setattr(self, field, value)
 
-    @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the boxscore string.
+        Creates a dictionary of all fields to include with DataFrame.
+
+        Returns
+        -------
+        dictionary
+            Returns a dictionary where the keys are the shortened ``string``
+            attribute names and the values are the actual value for each
+            attribute, or None if the game hasn't been played yet.
         """
         if self._points_for is None and self._points_against is None:
             return None
@@ -178,6 +191,17 @@ class Game:
             "time": self.time,
             "type": self.type,
         }
+        return fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the boxscore string.
+        """
+        fields_to_include = self._dataframe_fields()
+        if fields_to_include is None:
+            return None
         return pd.DataFrame([fields_to_include], index=[self._boxscore])
 
     @property
@@ -245,9 +269,14 @@ class Game:
     def boxscore(self):
         """
         Returns an instance of the Boxscore class containing more detailed
-        stats on the game.
+        stats on the game. The boxscore is only downloaded the first time it is
+        requested and is shared by every game with the same boxscore URI.
         """
-        return Boxscore(self._boxscore)
+        if self._boxscore_instance is None:
+            self._boxscore_instance = registry.get_boxscore(
+                "ncaab", self._boxscore, Boxscore
+            )
+        return self._boxscore_instance
 
     @property
     def boxscore_index(self):
@@ -421,7 +450,9 @@ class Schedule:
 
     def __init__(self, abbreviation, year=None):
         self._games = []
+        self._dates = None
         self._pull_schedule(abbreviation, year)
+        self._games = compact_if_enabled(self._games)
 
     def __getitem__(self, index):
         """
@@ -443,6 +474,30 @@ class Schedule:
         """
         return self._games[index]
 
+    def _date_index(self):
+        """
+        Group the games in the schedule by the day they were played.
+
+        The index is built the first time a game is requested by date and is
+        reused for every subsequent request, so finding a game doesn't require
+        checking the date of every game in the schedule.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` where each key is a ``tuple`` of the year,
+            month, and day and each value is a ``list`` of the Game instances
+            played on that day in schedule order.
+        """
+        if self._dates is None:
+            dates = {}
+            for game in self._games:
+                game_datetime = game.datetime
+                day = (game_datetime.year, game_datetime.month, game_datetime.day)
+                dates.setdefault(day, []).append(game)
+            self._dates = dates
+        return self._dates
+
     def __call__(self, date):
         """
         Return a specified game.
@@ -468,14 +523,36 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if (
-                game.datetime.year == date.year
-                and game.datetime.month == date.month
-                and game.datetime.day == date.day
-            ):
-                return game
-        raise ValueError("No games found for requested date")
+        games = self._date_index().get((date.year, date.month, date.day))
+        if not games:
+            raise ValueError("No games found for requested date")
+        return games[0]
+
+    def games_between(self, start_date, end_date):
+        """
+        Return every game played within a range of dates.
+
+        Parameters
+        ----------
+        start_date : datetime
+            A datetime object of the first day to include. Any time of day is
+            ignored.
+        end_date : datetime
+            A datetime object of the last day to include. Any time of day is
+            ignored.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of the Game instances played between both dates,
+            inclusive, in the order they were played.
+        """
+        dates = self._date_index()
+        start = (start_date.year, start_date.month, start_date.day)
+        end = (end_date.year, end_date.month, end_date.day)
+        return [
+            game for day in sorted(dates) if start <= day <= end for game in dates[day]
+        ]
 
     def __str__(self):
         """
@@ -516,19 +593,16 @@ class Schedule:
         year : string
             The requested year to pull stats from.
         """
+        doc = None
         if not year:
-            year = utils._find_year_for_season("ncaab")
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(
-                SCHEDULE_URL % (abbreviation.lower(), year)
-            ) and utils._url_exists(
-                SCHEDULE_URL % (abbreviation.lower(), str(int(year) - 1))
-            ):
-                year = str(int(year) - 1)
-        doc = utils._rate_limit_pq(SCHEDULE_URL % (abbreviation.lower(), year))
+            # case right before a new season begins), the previous year's
+            # stats are pulled instead.
+            year, doc = utils._resolve_season(
+                "ncaab", lambda season: SCHEDULE_URL % (abbreviation.lower(), season)
+            )
+        if doc is None:
+            doc = utils._rate_limit_pq(SCHEDULE_URL % (abbreviation.lower(), year))
         schedule = utils._get_stats_table(doc, "table#schedule")
         if not schedule:
             utils._no_data_found()
@@ -546,14 +620,18 @@ class Schedule:
         Returns a pandas DataFrame where each row is a representation of the
         Game class. Rows are indexed by the boxscore string.
         """
-        frames = []
+        rows = []
+        indices = []
         for game in self.__iter__():
-            df = game.dataframe
-            if df is not None:
-                frames.append(df)
-        if frames == []:
+            fields_to_include = game._dataframe_fields()
+            if fields_to_include is not None:
+                rows.append(fields_to_include)
+                indices.append(game._boxscore)
+        if rows == []:
             return None
-        return pd.concat(frames)
+        # The fields for every game are combined into a single DataFrame at
+        # once instead of creating and concatenating a DataFrame per game.
+        return rows_dataframe(rows, indices)
 
     @property
     def dataframe_extended(self):
@@ -564,11 +642,62 @@ class Schedule:
         selected game, but takes longer to process compared to the lighter
         'dataframe' property.
         """
-        frames = []
-        for game in self.__iter__():
-            df = game.dataframe_extended
-            if df is not None:
-                frames.append(df)
+        games = list(self.__iter__())
+        # Every boxscore is a separate page on the same host, so request them
+        # as a single batch which is downloaded concurrently.
+        extended = get_scheduler().map(
+            lambda game: game.dataframe_extended, games, BOXSCORE_URL
+        )
+        frames = [df for df in extended if df is not None]
         if frames == []:
             return None
         return pd.concat(frames)
+
+    def prefetch_boxscores(self):
+        """
+        Download the boxscores for every game in the schedule at once.
+
+        The boxscores of all games which have been played are requested as a
+        single batch which is downloaded and parsed concurrently. Every game
+        keeps its boxscore, so subsequent requests for ``Game.boxscore`` or
+        ``Game.dataframe_extended`` don't download the page again.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` where each key is a string of the
+            boxscore URI and each value is the Boxscore instance for the game.
+        """
+        games = [game for game in self._games if game._result and game.boxscore_index]
+        boxscores = get_scheduler().map(lambda game: game.boxscore, games, BOXSCORE_URL)
+        return {
+            game.boxscore_index: boxscore for game, boxscore in zip(games, boxscores)
+        }
+
+    def iter_boxscores(self):
+        """
+        Download the boxscores for every game in the schedule, yielding each
+        ``Boxscore`` as soon as it is parsed.
+
+        The boxscores of all games which have been played are downloaded and
+        parsed concurrently, and are yielded in the order they complete. Unlike
+        ``dataframe_extended`` and ``prefetch_boxscores``, the boxscores
+        aren't kept by the games, so each one can be processed and discarded
+        without holding the entire season in memory.
+
+        Yields
+        ------
+        Boxscore class instance
+            Yields the ``Boxscore`` of every game which has been played.
+        """
+        uris = [
+            game.boxscore_index
+            for game in self._games
+            if game._result and game.boxscore_index
+        ]
+        for _, boxscore in get_scheduler().as_completed(
+            lambda uri: registry.get_boxscore("ncaab", uri, Boxscore),
+            uris,
+            BOXSCORE_URL,
+        ):
+            yield boxscore
@@ -79,16 +79,16 @@ def _retrieve_all_teams(year, season_page, offensive_stats, defensive_stats):
     """
     team_data_dict = {}
 
+    doc = None
     if not year:
-        year = utils._find_year_for_season("ncaaf")
         # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(SEASON_PAGE_URL % year) and utils._url_exists(
-            SEASON_PAGE_URL % str(int(year) - 1)
-        ):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_page)
+        # right before a new season begins), the previous year's stats are
+        # pulled instead.
+        year, doc = utils._resolve_season(
+            "ncaaf", lambda season: SEASON_PAGE_URL % season
+        )
+    if doc is None or season_page:
+        doc = utils._pull_page(SEASON_PAGE_URL % year, season_page)
     teams_list = utils._get_stats_table(doc, "div#div_standings")
     offense_doc = utils._pull_page(OFFENSIVE_STATS_URL % year, offensive_stats)
     offense_list = utils._get_stats_table(offense_doc, "table#offense")
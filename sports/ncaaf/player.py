@@ -5,9 +5,26 @@ from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
+from ..decorators import cached_conversion
 from .constants import BOXSCORE_RETRY, PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
 
 
+@cached_conversion
+def _int_value(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@cached_conversion
+def _float_value(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
@@ -15,7 +32,7 @@ def _int_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            return int(prop[index])
+            return _int_value(prop[index])
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
@@ -30,7 +47,7 @@ def _float_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            return float(prop[index])
+            return _float_value(prop[index])
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
@@ -64,10 +81,10 @@ class AbstractPlayer:
     player_name : string
         A string representing the player's first and last name, such as 'David
         Blough'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : PyQuery object
+        A PyQuery object of the player's table rows from the Boxscore page.
+        If the player appears in multiple tables, the rows from every table
+        are combined into the single object.
     """
 
     def __init__(self, player_id, player_name, player_data):
@@ -161,14 +178,20 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or PyQuery object
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
+            season and each value contains a PyQuery object of the season's
+            table rows. If this class is inherited from the ``BoxscorePlayer``
+            class, player_data will be a PyQuery object of the player's rows
+            in the boxscore.
+        """
+        # Create the PyQuery object for every season a single time up front so
+        # it can be shared while extracting each of the fields.
+        if type(player_data) == dict:
+            seasons = [pq(data["data"]) for data in player_data.values()]
+        else:
+            seasons = [pq(player_data)]
         for field in self.__dict__:
             short_field = str(field)[1:]
             if (
@@ -181,16 +204,7 @@ class AbstractPlayer:
                 or short_field == "season"
             ):
                 continue
-            field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data["data"])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
-                value = self._parse_value(stats, short_field)
-                field_stats.append(value)
+            field_stats = [self._parse_value(stats, short_field) for stats in seasons]
             setattr(self, field, field_stats)
 
     @property
@@ -1,5 +1,4 @@
 import re
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from .constants import CFP_RANKINGS_URL, RANKINGS_SCHEME, RANKINGS_URL
@@ -58,7 +57,7 @@ class Rankings:
             # The AP poll is commented out in the HTML. I think there is a javascript action to enable
             # the AP table after scrolling, but it is inaccessible with unaltered html.
             doc = utils._rate_limit_pq(RANKINGS_URL % year)
-            return pq(utils._remove_html_comment_tags(doc))
+            return utils._uncommented_page(doc)
         except HTTPError:
             return None
 
@@ -1,7 +1,17 @@
 import pandas as pd
 import re
-from .constants import PARSING_SCHEME, CONFERENCE_DICT
+import threading
+from .constants import (
+    PARSING_SCHEME,
+    CONFERENCE_DICT,
+    BOXSCORE_URL,
+    ROSTER_URL,
+    SCHEDULE_URL,
+)
+from ..columns import rows_dataframe
+from ..compact import compact_if_enabled
 from ..decorators import float_property_decorator, int_property_decorator
+from ..scheduler import get_scheduler
 from .. import utils
 from .conferences import Conferences
 from .ncaaf_utils import _retrieve_all_teams
@@ -129,6 +139,13 @@ class Team:
             self._team_conference = conferences_dict[team_name.lower()]
 
         self._parse_team_data(team_data)
+        self._schedule_instance = None
+        self._roster_instance = None
+        # The schedule and roster can be requested by multiple threads at
+        # once, such as while Teams.prefetch_rosters is running, so each is
+        # only created by a single thread.
+        self._schedule_lock = threading.Lock()
+        self._roster_lock = threading.Lock()
 
     def __str__(self):
         """
@@ -210,12 +227,16 @@ class Team:
             value = utils._parse_field(PARSING_SCHEME, team_data, str(field)[1:])
             setattr(self, field, value)
 
-    @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'PURDUE'.
+        Creates a dictionary of all fields to include with DataFrame.
+
+        Returns
+        -------
+        dictionary
+            Returns a dictionary where the keys are the shortened ``string``
+            attribute names and the values are the actual value for each
+            attribute.
         """
         fields_to_include = {
             "abbreviation": self.abbreviation,
@@ -275,7 +296,16 @@ class Team:
             "yards_per_play": self.yards_per_play,
             "opponents_yards_per_play": self.opponents_yards_per_play,
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+        return fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'PURDUE'.
+        """
+        return pd.DataFrame([self._dataframe_fields()], index=[self._abbreviation])
 
     @property
     def conference(self):
@@ -297,17 +327,38 @@ class Team:
     def schedule(self):
         """
         Returns an instance of the Schedule class containing the team's
-        complete schedule for the season.
+        complete schedule for the season. The schedule is only downloaded the
+        first time it is requested.
         """
-        return Schedule(self._abbreviation, self._year)
+        with self._schedule_lock:
+            if self._schedule_instance is None:
+                self._schedule_instance = Schedule(self._abbreviation, self._year)
+            return self._schedule_instance
 
     @property
     def roster(self):
         """
         Returns an instance of the Roster class containing all players for the
-        team during the season with all career stats.
+        team during the season with all career stats. The roster is only
+        downloaded the first time it is requested.
+        """
+        with self._roster_lock:
+            if self._roster_instance is None:
+                self._roster_instance = Roster(self._abbreviation, self._year)
+            return self._roster_instance
+
+    def clear_cache(self):
+        """
+        Discard the team's schedule and roster.
+
+        The schedule and roster are downloaded again the next time they are
+        requested, such as after new games have been played during the
+        season.
         """
-        return Roster(self._abbreviation, self._year)
+        with self._schedule_lock:
+            self._schedule_instance = None
+        with self._roster_lock:
+            self._roster_instance = None
 
     @property
     def name(self):
@@ -785,13 +836,16 @@ class Teams:
             year, season_page, offensive_stats, defensive_stats
         )
         self._instantiate_teams(team_data_dict, year)
+        self._teams = compact_if_enabled(self._teams)
+        self._index_teams()
 
     def __getitem__(self, abbreviation):
         """
         Return a specified team.
 
         Returns a team's instance in the Teams class as specified by the team's
-        short name.
+        short name. The team's full name can also be used if no team has a
+        matching short name.
 
         Parameters
         ----------
@@ -809,11 +863,34 @@ class Teams:
         ValueError
             If the requested team is not present within the Teams list.
         """
-        for team in self._teams:
-            if team.abbreviation.upper() == abbreviation.upper():
-                return team
+        # The index is rebuilt if the list of teams has been replaced since
+        # it was last built.
+        if self._indexed_teams is not self._teams:
+            self._index_teams()
+        key = abbreviation.upper()
+        if key in self._abbreviations:
+            return self._abbreviations[key]
+        if key in self._names:
+            return self._names[key]
         raise ValueError("Team abbreviation %s not found" % abbreviation)
 
+    def _index_teams(self):
+        """
+        Index every team by its abbreviation and name.
+
+        Requesting a team is a single lookup in the index instead of comparing
+        the abbreviation of every team. If multiple teams share an
+        abbreviation or name, the first team in the list is kept.
+        """
+        self._abbreviations = {}
+        self._names = {}
+        for team in self._teams:
+            if team.abbreviation:
+                self._abbreviations.setdefault(team.abbreviation.upper(), team)
+            if team.name:
+                self._names.setdefault(team.name.upper(), team)
+        self._indexed_teams = self._teams
+
     def __call__(self, abbreviation):
         """
         Return a specified team.
@@ -855,6 +932,79 @@ class Teams:
         """Returns the number of NCAAF teams for a given season."""
         return len(self._teams)
 
+    def prefetch_schedules(self):
+        """
+        Download the schedule of every team at once.
+
+        The schedules are requested as a single batch which is downloaded and
+        parsed concurrently. Every team keeps its schedule, so subsequent
+        requests for ``Team.schedule`` don't download the page again.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` where each key is a string of the team's
+            abbreviation and each value is the Schedule instance for the team.
+        """
+        schedules = get_scheduler().map(
+            lambda team: team.schedule, self._teams, SCHEDULE_URL
+        )
+        return {
+            team.abbreviation: schedule
+            for team, schedule in zip(self._teams, schedules)
+        }
+
+    def prefetch_rosters(self):
+        """
+        Download the roster of every team at once.
+
+        The rosters are requested as a single batch which is downloaded and
+        parsed concurrently. Every team keeps its roster, so subsequent
+        requests for ``Team.roster`` don't download the pages again.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` where each key is a string of the team's
+            abbreviation and each value is the Roster instance for the team.
+        """
+        rosters = get_scheduler().map(lambda team: team.roster, self._teams, ROSTER_URL)
+        return {team.abbreviation: roster for team, roster in zip(self._teams, rosters)}
+
+    def prefetch_boxscores(self):
+        """
+        Download the boxscore of every game played by any team at once.
+
+        Every game appears in the schedules of both teams which played it.
+        Instead of downloading each game's boxscore once for every schedule,
+        the boxscores are collected across the schedules of all teams so each
+        game is only downloaded and parsed a single time, and both teams' games
+        share the same Boxscore instance. Subsequent requests for
+        ``Game.boxscore`` or ``Schedule.dataframe_extended`` on any team don't
+        download the page again.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` where each key is a string of the
+            boxscore URI and each value is the Boxscore instance for the game.
+        """
+        games = {}
+        for schedule in self.prefetch_schedules().values():
+            for game in schedule._games:
+                if game._result and game.boxscore_index:
+                    games.setdefault(game.boxscore_index, []).append(game)
+        uris = list(games)
+        # Only the first game for each boxscore is requested, and its boxscore
+        # is then shared with the other team's game.
+        boxscores = get_scheduler().map(
+            lambda uri: games[uri][0].boxscore, uris, BOXSCORE_URL
+        )
+        for uri, boxscore in zip(uris, boxscores):
+            for game in games[uri][1:]:
+                game._boxscore_instance = boxscore
+        return dict(zip(uris, boxscores))
+
     def _instantiate_teams(self, team_data_dict, year):
         """
         Create a Team instance for all teams.
@@ -892,7 +1042,22 @@ class Teams:
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
+        teams = list(self.__iter__())
+        # The fields for every team are combined into a single DataFrame at
+        # once instead of creating and concatenating a DataFrame per team.
+        rows = [team._dataframe_fields() for team in teams]
+        return rows_dataframe(rows, [team._abbreviation for team in teams])
+
+    @property
+    def dataframe_extended(self):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game played by any team during the season.
+        Every game is only included once, even though it appears in the
+        schedules of both teams. Rows are indexed by the boxscore string.
+        """
+        frames = [boxscore.dataframe for boxscore in self.prefetch_boxscores().values()]
+        frames = [df for df in frames if df is not None]
+        if frames == []:
+            return None
         return pd.concat(frames)
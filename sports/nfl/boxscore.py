@@ -3,9 +3,11 @@ import re
 from datetime import datetime
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import registry, utils
+from ..compact import compact_if_enabled
 from ..constants import AWAY, HOME
 from ..decorators import int_property_decorator
+from ..scheduler import get_scheduler
 from .constants import (
     BOXSCORE_ELEMENT_INDEX,
     BOXSCORE_ELEMENT_SUB_INDEX,
@@ -71,10 +73,10 @@ class BoxscorePlayer(AbstractPlayer):
     player_name : string
         A string representing the player's first and last name, such as 'David
         Blough'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : PyQuery object
+        A PyQuery object of the player's table rows from the Boxscore page.
+        If the player appears in multiple tables, the rows from every table
+        are combined into the single object.
     """
 
     def __init__(self, player_id, player_name, player_data):
@@ -339,7 +341,7 @@ class Boxscore:
         # to be manually checked.
         if "404 error" in str(url_data):
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._uncommented_page(url_data)
 
     def _parse_game_details(self, boxscore):
         """
@@ -629,11 +631,11 @@ class Boxscore:
             name = self._find_player_name(row)
             home_or_away = self._find_home_or_away(row)
             try:
-                player_dict[player_id]["data"] += str(row).strip()
+                player_dict[player_id]["data"] += row
             except KeyError:
                 player_dict[player_id] = {
                     "name": name,
-                    "data": str(row).strip(),
+                    "data": row,
                     "team": home_or_away,
                 }
         return player_dict
@@ -797,6 +799,8 @@ class Boxscore:
         self._parse_game_details(boxscore)
         self._away_abbr, self._home_abbr = self._alt_abbreviations(boxscore)
         self._away_players, self._home_players = self._find_players(boxscore)
+        self._away_players = compact_if_enabled(self._away_players)
+        self._home_players = compact_if_enabled(self._home_players)
 
     @property
     def dataframe(self):
@@ -1516,6 +1520,79 @@ class Boxscores:
         """
         return self._boxscores
 
+    @classmethod
+    def iter_games(cls, week, year, end_week=None):
+        """
+        Search for games, yielding each week's games as soon as they are found.
+
+        Unlike creating a ``Boxscores`` instance, which only returns once
+        every requested week has been pulled, the games for each week are
+        yielded as soon as the week's page is downloaded and parsed. Weeks
+        are yielded in the order they complete, which isn't necessarily the
+        order they were played in.
+
+        Parameters
+        ----------
+        week : int
+            The week number to pull games from.
+        year : int
+            The 4-digit year to pull games from.
+        end_week : int (optional)
+            Optionally specify an end week to iterate until. If left empty, or
+            if 'end_week' is prior to 'week', only the games from the week
+            specified in the 'week' parameter will be pulled.
+
+        Yields
+        ------
+        tuple
+            Yields a ``tuple`` of the week's string in the format 'W-YYYY' and
+            a ``list`` of the games played during that week in the same format
+            as the values of the ``games`` property.
+        """
+        # The search doesn't store anything on the instance, so it's created
+        # without pulling any weeks up front.
+        boxscores = cls.__new__(cls)
+        boxscores._boxscores = {}
+        weeks = boxscores._requested_weeks(week, end_week)
+        yield from boxscores._stream_games(weeks, year)
+
+    @classmethod
+    def iter_boxscores(cls, week, year, end_week=None):
+        """
+        Search for games, yielding the ``Boxscore`` of every game as soon as
+        it is parsed.
+
+        The boxscores for each week are requested as soon as the week's games
+        are found and are yielded in the order they complete, which allows
+        every game to be processed and discarded without holding the entire
+        range in memory.
+
+        Parameters
+        ----------
+        week : int
+            The week number to pull games from.
+        year : int
+            The 4-digit year to pull games from.
+        end_week : int (optional)
+            Optionally specify an end week to iterate until. If left empty, or
+            if 'end_week' is prior to 'week', only the games from the week
+            specified in the 'week' parameter will be pulled.
+
+        Yields
+        ------
+        Boxscore class instance
+            Yields the ``Boxscore`` of every game which has been played.
+        """
+        scheduler = get_scheduler()
+        for _, games in cls.iter_games(week, year, end_week):
+            uris = [game["boxscore"] for game in games if game["boxscore"]]
+            for _, boxscore in scheduler.as_completed(
+                lambda uri: registry.get_boxscore("nfl", uri, Boxscore),
+                uris,
+                BOXSCORE_URL,
+            ):
+                yield boxscore
+
     def _create_url(self, week, year):
         """
         Build the URL based on the passed week number.
@@ -1776,6 +1853,79 @@ class Boxscores:
             all_boxscores.append(game_info)
         return all_boxscores
 
+    def _requested_weeks(self, week, end_week):
+        """
+        Expand the requested range into every individual week.
+
+        Parameters
+        ----------
+        week : int
+            The first week to search for any matches.
+        end_week : int
+            Optionally specify the last week to search for any matches. If left
+            empty, or if 'end_week' is prior to 'week', only the week specified
+            in the 'week' parameter is included.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of every requested week number in order.
+        """
+        if not end_week or week > end_week:
+            end_week = week
+        return list(range(week, end_week + 1))
+
+    def _find_week_games(self, week, year):
+        """
+        Retrieve all games played during a single week.
+
+        Parameters
+        ----------
+        week : int
+            The week number to pull games from.
+        year : int
+            The 4-digit year to pull games from.
+
+        Returns
+        -------
+        tuple
+            Returns a ``tuple`` of the week's string in the format 'W-YYYY'
+            and a ``list`` of the games played during that week.
+        """
+        page = self._get_requested_page(self._create_url(week, year))
+        games = page('table[class="teams"]').items()
+        timestamp = "%s-%s" % (week, year)
+        return timestamp, self._extract_game_info(games)
+
+    def _stream_games(self, weeks, year):
+        """
+        Retrieve the games for every requested week as each week completes.
+
+        The pages for all weeks are downloaded and parsed concurrently by the
+        shared scheduler, which keeps the requests within the site's rate
+        limit and reads any cached pages instead of downloading them again.
+
+        Parameters
+        ----------
+        weeks : list
+            A ``list`` of every week number to search.
+        year : int
+            The 4-digit year to pull games from.
+
+        Yields
+        ------
+        tuple
+            Yields a ``tuple`` of the week's string in the format 'W-YYYY' and
+            a ``list`` of the games played during that week, in the order the
+            weeks complete.
+        """
+        urls = [self._create_url(week, year) for week in weeks]
+        scheduler = get_scheduler()
+        for _, week_games in scheduler.as_completed(
+            lambda week: self._find_week_games(week, year), weeks, urls
+        ):
+            yield week_games
+
     def _find_games(self, week, year, end_week):
         """
         Retrieve all major games played for a given week.
@@ -1800,13 +1950,10 @@ class Boxscores:
             the games from the day specified in the 'date' parameter will be
             saved.
         """
-        if not end_week or week > end_week:
-            end_week = week
-        while week <= end_week:
-            url = self._create_url(week, year)
-            page = self._get_requested_page(url)
-            games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
+        weeks = self._requested_weeks(week, end_week)
+        # Every week is downloaded and parsed concurrently, so the weeks can
+        # finish in any order and are saved in week order once all are done.
+        week_games = dict(self._stream_games(weeks, year))
+        for week in weeks:
             timestamp = "%s-%s" % (week, year)
-            self._boxscores[timestamp] = boxscores
-            week += 1
+            self._boxscores[timestamp] = week_games[timestamp]
@@ -2,9 +2,12 @@ import pandas as pd
 import re
 from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import registry, utils
+from ..columns import constant_column, season_column, season_columns
+from ..decorators import cached_conversion
+from ..lazy import LazyPlayer, materialize
+from ..scheduler import get_scheduler
 from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL, DETAILED_STATS
 from .player import AbstractPlayer
 
@@ -21,7 +24,30 @@ def _cleanup(prop):
         return ""
 
 
+@cached_conversion
+def _int_value(value):
+    try:
+        return int(_cleanup(value))
+    except ValueError:
+        return None
+
+
+@cached_conversion
+def _float_value(value):
+    try:
+        return float(_cleanup(value))
+    except ValueError:
+        return None
+
+
 def _int_property_decorator(func):
+    def value(prop, index):
+        try:
+            return _int_value(prop[index])
+        except (ValueError, TypeError, IndexError):
+            # If there is no value, default to None
+            return None
+
     @property
     @wraps(func)
     def wrapper(*args):
@@ -29,18 +55,23 @@ def _int_property_decorator(func):
             index = args[0]._detailed_stats_index
         else:
             index = args[0]._index
-        prop = func(*args)
+        return value(func(*args), index)
+
+    if func.__name__ in DETAILED_STATS:
+        # Detailed stats aren't indexed by season, so every season has the
+        # same value.
+        return constant_column(wrapper)
+    return season_column(wrapper, func, value)
+
+
+def _float_property_decorator(func):
+    def value(prop, index):
         try:
-            value = _cleanup(prop[index])
-            return int(value)
+            return _float_value(prop[index])
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
 
-    return wrapper
-
-
-def _float_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
@@ -48,15 +79,13 @@ def _float_property_decorator(func):
             index = args[0]._detailed_stats_index
         else:
             index = args[0]._index
-        prop = func(*args)
-        try:
-            value = _cleanup(prop[index])
-            return float(value)
-        except (ValueError, TypeError, IndexError):
-            # If there is no value, default to None
-            return None
+        return value(func(*args), index)
 
-    return wrapper
+    if func.__name__ in DETAILED_STATS:
+        # Detailed stats aren't indexed by season, so every season has the
+        # same value.
+        return constant_column(wrapper)
+    return season_column(wrapper, func, value)
 
 
 class Player(AbstractPlayer):
@@ -71,6 +100,12 @@ class Player(AbstractPlayer):
     single-season stats can be found by calling the instance with the requested
     season as denoted on pro-football-reference.com.
 
+    A player's page is only downloaded and parsed once, and every instance for
+    the same player shares the parsed stats. The stats are pulled again once
+    they are older than the page cache's default expiration of six hours.
+    Call ``sports.registry.clear()`` to get the latest stats before then, such
+    as in a long-running program.
+
     Parameters
     ----------
     player_id : string
@@ -226,11 +261,33 @@ class Player(AbstractPlayer):
         self._assists_on_tackles = None
         self._safeties = None
 
+        # The player's page is only downloaded and parsed once, no matter how
+        # many rosters the player is listed on. Every instance gets its own
+        # copy of the parsed fields, so requesting a season from one instance
+        # doesn't change the season of any other.
+        fields = registry.get_player(
+            "nfl", player_id, self._parse_player, self._build_url
+        )
+        if fields:
+            self.__dict__.update(fields)
+
+    def _parse_player(self):
+        """
+        Download and parse the player's page.
+
+        Returns
+        -------
+        dictionary
+            Returns a ``dictionary`` of every parsed field, which is shared by
+            all instances for the player, or None if the player's page
+            couldn't be pulled.
+        """
         player_data = self._pull_player_data()
         if not player_data:
-            return
+            return None
         self._find_initial_index()
-        AbstractPlayer.__init__(self, player_id, self._name, player_data)
+        AbstractPlayer.__init__(self, self._player_id, self._name, player_data)
+        return dict(self.__dict__)
 
     def __str__(self):
         """
@@ -285,7 +342,7 @@ class Player(AbstractPlayer):
         # to be manually checked.
         if "Page Not Found (404 error)" in str(url_data):
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._uncommented_page(url_data)
 
     def _parse_season(self, row):
         """
@@ -327,8 +384,8 @@ class Player(AbstractPlayer):
         all_stats_dict : dictionary
             A dictionary of all stats separated by season where each key is the
             season ``string``, such as '2017', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+            ``dictionary`` with a ``string`` of 'data' and a PyQuery object
+            of every table row for the season.
         detailed : boolean
             A boolean which evaluates to True if the passed table is one of the
             advanced stats tables which is labeled as 'detailed' on the site.
@@ -346,9 +403,9 @@ class Player(AbstractPlayer):
         for row in table_rows:
             season = self._parse_season(row)
             try:
-                all_stats_dict[season]["data"] += str(row)
+                all_stats_dict[season]["data"] += row
             except KeyError:
-                all_stats_dict[season] = {"data": str(row)}
+                all_stats_dict[season] = {"data": row}
             # Create a list of detailed stats which aren't populated for all
             # seasons a player has been active.
             if detailed:
@@ -363,10 +420,10 @@ class Player(AbstractPlayer):
         if not career_stats:
             return all_stats_dict
         try:
-            all_stats_dict["Career"]["data"] += str(next(career_stats))
+            all_stats_dict["Career"]["data"] += next(career_stats)
         except KeyError:
             try:
-                all_stats_dict["Career"] = {"data": str(next(career_stats))}
+                all_stats_dict["Career"] = {"data": next(career_stats)}
             # Occurs when the player doesn't have any career stats listed on
             # their page in error.
             except StopIteration:
@@ -490,6 +547,35 @@ class Player(AbstractPlayer):
                 break
             index += 1
 
+    def _season_position(self, season):
+        """
+        Find the position of a season's stats.
+
+        Every season's stats are stored in the same order as the player's list
+        of seasons. The position of each season is kept in an index which is
+        built the first time a season is requested and is rebuilt if the list
+        of seasons is replaced.
+
+        Parameters
+        ----------
+        season : string
+            The requested season, such as 'Career'.
+
+        Returns
+        -------
+        int
+            Returns an ``int`` of the position of the season's stats, or None
+            if the player doesn't have any stats for the season.
+        """
+        season_index = getattr(self, "_season_index", None)
+        if season_index is None or season_index[0] is not self._season:
+            positions = {}
+            for position, name in enumerate(self._season or []):
+                positions.setdefault(name, position)
+            season_index = (self._season, positions)
+            self._season_index = season_index
+        return season_index[1].get(season)
+
     def __call__(self, requested_season=""):
         """
         Specify a different season to pull stats from.
@@ -511,14 +597,11 @@ class Player(AbstractPlayer):
         """
         if requested_season.lower() == "career" or requested_season == "":
             requested_season = "Career"
-        index = 0
         if not self._season:
             return self
-        for season in self._season:
-            if season == requested_season:
-                self._index = index
-                break
-            index += 1
+        index = self._season_position(requested_season)
+        if index is not None:
+            self._index = index
         detailed_index = 0
         if not self._detailed_stats_seasons:
             return self
@@ -681,17 +764,13 @@ class Player(AbstractPlayer):
         properties and values where each index is a different season plus the
         career stats.
         """
-        temp_index = self._index
-        rows = []
-        indices = []
         if not self._season:
             return None
-        for season in self._season:
-            self._index = self._season.index(season)
-            rows.append(self._dataframe_fields())
-            indices.append(season)
-        self._index = temp_index
-        return pd.DataFrame(rows, index=[indices])
+        # Every field is read for all seasons at once without changing the
+        # season the player currently refers to.
+        positions = [self._season_position(season) for season in self._season]
+        columns = season_columns(type(self)._dataframe_fields, self, positions)
+        return pd.DataFrame(columns, index=[list(self._season)])
 
     @property
     def season(self):
@@ -1688,11 +1767,19 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    lazy : boolean (optional)
+        Set to True to only download each player's page the first time any of
+        their stats are requested. Each player is returned as a placeholder
+        containing the name and player ID from the roster which otherwise
+        behaves the same as a ``Player`` instance. Use ``materialize`` to
+        download a group of players at once. Ignored when ``slim`` is True.
+        Defaults to False.
     """
 
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, lazy=False):
         self._team = team
         self._slim = slim
+        self._lazy = lazy
         self._coach = None
         if slim:
             self._players = {}
@@ -1716,7 +1803,7 @@ class Roster:
         """
         return self.__str__()
 
-    def _pull_team_page(self, url):
+    def _pull_team_page(self, url, doc=None):
         """
         Download the team page.
 
@@ -1726,6 +1813,9 @@ class Roster:
         ----------
         url : string
             A string of the built URL for the requested team and season.
+        doc : PyQuery object (optional)
+            The team's page if it was already downloaded while determining
+            the season, in which case it isn't downloaded again.
 
         Returns
         -------
@@ -1733,9 +1823,10 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            doc = utils._rate_limit_pq(url)
+            if doc is None:
+                doc = utils._rate_limit_pq(url)
             if doc:
-                return pq(utils._remove_html_comment_tags(doc))
+                return utils._uncommented_page(doc)
             else:
                 return None
         except HTTPError:
@@ -1842,42 +1933,75 @@ class Roster:
             The 4-digit string representing the year to pull the team's roster
             from.
         """
+        doc = None
         if not year:
-            year = utils._find_year_for_season("nfl")
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(self._create_url(year)) and utils._url_exists(
-                self._create_url(str(int(year) - 1))
-            ):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are pulled instead.
+            year, doc = utils._resolve_season("nfl", self._create_url)
         url = self._create_url(year)
-        page = self._pull_team_page(url)
+        page = self._pull_team_page(url, doc)
         if not page:
             output = (
                 "Can't pull requested team page. Ensure the following "
                 "URL exists: %s" % url
             )
             raise ValueError(output)
+        player_ids = []
         for player in page("table#roster tbody tr").items():
             player_id = self._get_id(player)
             if self._slim:
                 name = self._get_name(player)
                 self._players[player_id] = name
+            elif self._lazy:
+                name = self._get_name(player)
+                self._players.append(LazyPlayer(Player, player_id, name, url))
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
+        # Every player has their own page, so request them as a single batch
+        # which is downloaded concurrently while preserving the roster order.
+        if player_ids:
+            self._players.extend(get_scheduler().map(Player, player_ids, url))
 
         self._coach = self._parse_coach(page)
 
+    def materialize(self, player_ids=None):
+        """
+        Download the stats for players on a lazy roster.
+
+        The pages for all requested players which haven't been downloaded yet
+        are pulled concurrently, which is much faster than requesting each
+        player's stats one at a time.
+
+        Parameters
+        ----------
+        player_ids : list (optional)
+            A ``list`` of the IDs of the players to download. If left blank,
+            every player on the roster is downloaded.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of ``Player`` instances for the requested
+            players in roster order.
+        """
+        if self._slim:
+            raise ValueError("Players on a slim roster can't be downloaded.")
+        players = self._players
+        if player_ids is not None:
+            player_ids = set(player_ids)
+            players = [player for player in players if player.player_id in player_ids]
+        return materialize(players)
+
     @property
     def players(self):
         """
         Returns a ``list`` of player instances for each player on the requested
         team's roster if the ``slim`` property is False when calling the Roster
-        class. If the ``slim`` property is True, returns a ``dictionary`` where
-        each key is a string of the player's ID and each value is the player's
+        class. If the ``lazy`` property is True, each player's stats are only
+        downloaded once they are first requested. If the ``slim`` property is
+        True, returns a ``dictionary`` where each key is a string of the
+        player's ID and each value is the player's
         first and last name as listed on the roster page.
         """
         return self._players
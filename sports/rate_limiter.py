@@ -0,0 +1,188 @@
+import threading
+import time
+from urllib.parse import urlparse
+from .constants import REQUESTS_BURST, REQUESTS_PER_MINUTE
+
+
+class TokenBucket:
+    """
+    Limit the rate of requests sent to a single host.
+
+    The bucket holds a number of tokens which refill at a constant rate. Each
+    request consumes a single token, and requests are only delayed when the
+    bucket is empty, allowing short bursts of requests to be sent immediately
+    while still keeping the long-term rate at or below the requested limit.
+
+    Tokens are reserved when a request is made, so concurrent callers are
+    spaced out evenly instead of all waking up at the same time once the
+    bucket refills.
+
+    Parameters
+    ----------
+    requests_per_minute : int (optional)
+        The number of requests allowed per minute once the bucket is empty.
+    burst : int (optional)
+        The maximum number of tokens the bucket can hold, which is the largest
+        number of requests that can be sent back-to-back without waiting.
+    """
+
+    def __init__(self, requests_per_minute=REQUESTS_PER_MINUTE, burst=REQUESTS_BURST):
+        self._requests_per_minute = requests_per_minute
+        self._rate = requests_per_minute / 60.0
+        self._capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, requests_per_minute):
+        """
+        Change the number of requests allowed per minute.
+
+        Tokens which refilled at the previous rate are kept, and the bucket
+        refills at the new rate from now on.
+
+        Parameters
+        ----------
+        requests_per_minute : int
+            The number of requests allowed per minute once the bucket is empty.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+            self._requests_per_minute = requests_per_minute
+            self._rate = requests_per_minute / 60.0
+
+    @property
+    def requests_per_minute(self):
+        """
+        Returns an ``int`` of the number of requests allowed per minute once
+        the bucket is empty.
+        """
+        return self._requests_per_minute
+
+    def _reserve(self):
+        """
+        Reserve a token from the bucket.
+
+        Returns
+        -------
+        float
+            Returns a ``float`` of the number of seconds the caller needs to
+            wait before the reserved token is available. Returns 0 if a token
+            is available immediately.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self._rate
+
+    def acquire(self):
+        """
+        Take a token from the bucket, waiting until one is available.
+
+        Returns
+        -------
+        float
+            Returns a ``float`` of the number of seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def _host(url):
+    """
+    Find the host a URL points to.
+
+    Parameters
+    ----------
+    url : string
+        The URL of the requested page.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the host without any leading 'www.', such as
+        'basketball-reference.com', so requests sent over both HTTP and HTTPS
+        or with and without the 'www.' prefix share the same budget.
+    """
+    host = urlparse(url).netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def get_bucket(url, requests_per_minute=REQUESTS_PER_MINUTE, burst=REQUESTS_BURST):
+    """
+    Get the token bucket for the host of a URL.
+
+    Every host has a single bucket which is shared across the entire process,
+    so requests to different sites, such as basketball-reference.com and
+    fbref.com, never consume each other's budget.
+
+    Parameters
+    ----------
+    url : string
+        The URL of the requested page.
+    requests_per_minute : int (optional)
+        The number of requests allowed per minute for the host. If the host's
+        bucket already exists with a different rate, the bucket is changed to
+        refill at this rate.
+    burst : int (optional)
+        The largest number of back-to-back requests allowed if the bucket for
+        the host doesn't exist yet.
+
+    Returns
+    -------
+    TokenBucket instance
+        Returns the ``TokenBucket`` for the URL's host.
+    """
+    host = _host(url)
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(requests_per_minute, burst)
+        bucket = _buckets[host]
+    if bucket.requests_per_minute != requests_per_minute:
+        bucket.set_rate(requests_per_minute)
+    return bucket
+
+
+def acquire(url, requests_per_minute=REQUESTS_PER_MINUTE):
+    """
+    Wait until a request can be sent to the host of a URL.
+
+    Parameters
+    ----------
+    url : string
+        The URL of the requested page.
+    requests_per_minute : int (optional)
+        The number of requests allowed per minute for the URL's host.
+
+    Returns
+    -------
+    float
+        Returns a ``float`` of the number of seconds spent waiting.
+    """
+    return get_bucket(url, requests_per_minute).acquire()
+
+
+def reset():
+    """
+    Remove the token buckets for every host.
+
+    Every host starts with a full bucket on its next request.
+    """
+    with _buckets_lock:
+        _buckets.clear()
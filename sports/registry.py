@@ -0,0 +1,281 @@
+import threading
+import time
+from collections import OrderedDict
+from . import utils
+from .constants import BOXSCORE_REGISTRY_SIZE, CACHE_EXPIRATION, PLAYER_REGISTRY_SIZE
+
+
+class Registry:
+    """
+    Share a single instance of an object for every key across the process.
+
+    Objects such as ``Boxscore`` are expensive to create as their page needs
+    to be downloaded and parsed, but the same game can be referenced from the
+    schedules of both teams or requested multiple times by the same program.
+    The registry keeps the most recently used instances so each one is only
+    created once, even when multiple threads request the same key at the same
+    time.
+
+    Parameters
+    ----------
+    max_size : int (optional)
+        The maximum number of instances to keep. Once the limit is reached, the
+        least recently used instance is dropped. Set to None to keep every
+        instance.
+    expiration : int (optional)
+        The number of seconds an instance which is able to change is kept
+        before it is created again, matching how long the page cache keeps a
+        page. Set to None to keep instances until they are dropped or removed.
+    """
+
+    def __init__(self, max_size=None, expiration=None):
+        self._max_size = max_size
+        self._expiration = expiration
+        self._items = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items and not self._expired(key)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def _lookup(self, key):
+        """
+        Find a registered instance and mark it as recently used.
+
+        The registry's lock must be held by the caller.
+
+        Parameters
+        ----------
+        key : hashable
+            The key the instance was registered under.
+
+        Returns
+        -------
+        tuple
+            Returns a ``tuple`` of a ``boolean`` which is True when the key is
+            registered and the instance, if any.
+        """
+        if key in self._items:
+            if self._expired(key):
+                del self._items[key]
+                return False, None
+            self._items.move_to_end(key)
+            return True, self._items[key][0]
+        return False, None
+
+    def _expired(self, key):
+        """
+        Determine if a registered instance has been kept for too long.
+
+        The registry's lock must be held by the caller.
+
+        Parameters
+        ----------
+        key : hashable
+            The key the instance was registered under.
+
+        Returns
+        -------
+        bool
+            Evaluates to True when the instance is able to change and was
+            registered more than the registry's expiration ago.
+        """
+        expires_at = self._items[key][1]
+        return expires_at is not None and time.monotonic() >= expires_at
+
+    def get(self, key, factory, expires=True):
+        """
+        Get the instance for a key, creating it if necessary.
+
+        Parameters
+        ----------
+        key : hashable
+            The key which uniquely identifies the instance, such as a
+            ``tuple`` of the league and the boxscore URI.
+        factory : callable
+            A function which takes no arguments and creates the instance if
+            it isn't registered yet or has expired.
+        expires : boolean (optional)
+            Set to False if the instance can never change, such as the
+            boxscore of a game from a previous season, in which case it is
+            kept regardless of its age.
+
+        Returns
+        -------
+        object
+            Returns the registered instance for the key.
+        """
+        with self._lock:
+            found, instance = self._lookup(key)
+            if found:
+                return instance
+            key_lock = self._pending.setdefault(key, threading.Lock())
+        # Only a single thread creates the instance for a key while any others
+        # requesting the same key wait for it to be registered.
+        with key_lock:
+            with self._lock:
+                found, instance = self._lookup(key)
+                if found:
+                    return instance
+            try:
+                instance = factory()
+            except BaseException:
+                with self._lock:
+                    self._pending.pop(key, None)
+                raise
+            # The instance is registered before the pending lock is removed so
+            # any thread arriving in between finds one or the other.
+            with self._lock:
+                self._store(key, instance, expires)
+                self._pending.pop(key, None)
+            return instance
+
+    def _store(self, key, instance, expires):
+        """
+        Register an instance, dropping the least recently used instances once
+        the registry is full.
+
+        The registry's lock must be held by the caller.
+
+        Parameters
+        ----------
+        key : hashable
+            The key which uniquely identifies the instance.
+        instance : object
+            The instance to register.
+        expires : boolean
+            Set to False if the instance can never change.
+        """
+        expires_at = None
+        if expires and self._expiration is not None:
+            expires_at = time.monotonic() + self._expiration
+        self._items[key] = (instance, expires_at)
+        self._items.move_to_end(key)
+        if self._max_size is not None:
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def set(self, key, instance, expires=True):
+        """
+        Register an instance, replacing any existing instance for the key.
+
+        Parameters
+        ----------
+        key : hashable
+            The key which uniquely identifies the instance.
+        instance : object
+            The instance to register.
+        expires : boolean (optional)
+            Set to False if the instance can never change.
+        """
+        with self._lock:
+            self._store(key, instance, expires)
+
+    def remove(self, key):
+        """
+        Remove the instance for a key so it is created again when requested.
+
+        Parameters
+        ----------
+        key : hashable
+            The key the instance was registered under.
+        """
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        """
+        Remove every registered instance.
+        """
+        with self._lock:
+            self._items.clear()
+
+
+_boxscores = Registry(BOXSCORE_REGISTRY_SIZE)
+_players = Registry(PLAYER_REGISTRY_SIZE, CACHE_EXPIRATION)
+
+
+def get_boxscore(league, uri, boxscore_class):
+    """
+    Get the shared ``Boxscore`` instance for a game.
+
+    Parameters
+    ----------
+    league : string
+        The league the game was played in, such as 'nba', which keeps the
+        boxscores of different leagues apart.
+    uri : string
+        The game's boxscore URI, such as '201710310LAL'.
+    boxscore_class : class
+        The league's ``Boxscore`` class which is created with the URI if the
+        game hasn't been requested yet.
+
+    Returns
+    -------
+    Boxscore class instance
+        Returns the ``Boxscore`` for the requested game.
+    """
+    # Games which haven't been played yet don't have a boxscore to share.
+    if not uri:
+        return boxscore_class(uri)
+    return _boxscores.get((league, uri), lambda: boxscore_class(uri))
+
+
+def get_player(league, player_id, parse, build_url):
+    """
+    Get the shared parsed fields of a player.
+
+    A player's page includes their stats for every season of their career, so
+    it only needs to be downloaded and parsed once, no matter how many rosters
+    the player is listed on. The fields are shared by every ``Player``
+    instance for the player and must not be modified; each instance copies
+    them so it can request a different season without affecting any other.
+
+    The fields of a player whose page can change, such as an active player's
+    current season stats, are kept for as long as the page cache would keep
+    their page, after which the page is pulled again.
+
+    Parameters
+    ----------
+    league : string
+        The league the player plays in, such as 'nba', which keeps the players
+        of different leagues apart.
+    player_id : string
+        The player's ID as used in the URL of their page, such as
+        'hardeja01'.
+    parse : callable
+        A function which takes no arguments, downloads and parses the
+        player's page, and returns a ``dictionary`` of the parsed fields. It
+        returns None if the page couldn't be pulled, in which case nothing is
+        kept and the page is requested again next time.
+    build_url : callable
+        A function which takes no arguments and returns the URL of the
+        player's page.
+
+    Returns
+    -------
+    dictionary
+        Returns the ``dictionary`` of the player's parsed fields, or None if
+        the player's page couldn't be pulled.
+    """
+    if not player_id:
+        return parse()
+    expires = utils._page_expires(build_url())
+    fields = _players.get((league, player_id), parse, expires)
+    if fields is None:
+        _players.remove((league, player_id))
+    return fields
+
+
+def clear():
+    """
+    Remove every shared instance, such as after the site has been updated
+    with the results of new games.
+    """
+    _boxscores.clear()
+    _players.clear()
@@ -0,0 +1,219 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from . import utils
+from .constants import REQUESTS_BURST
+from .rate_limiter import _host
+
+# Records the host whose pool the current thread belongs to, if any.
+_worker = threading.local()
+
+
+def _mark_worker(host):
+    """
+    Record the host of the pool a worker thread belongs to.
+
+    Parameters
+    ----------
+    host : string
+        The host the worker thread's pool is dedicated to.
+    """
+    _worker.host = host
+
+
+class FetchScheduler:
+    """
+    Run page requests for multiple hosts concurrently.
+
+    Every host, such as basketball-reference.com or fbref.com, has its own
+    pool of worker threads so requests to different sites run in parallel
+    while each site is still limited by its own token bucket in
+    ``utils._rate_limit_pq``. A job which pulls NBA, NHL, and MLB pages takes
+    roughly as long as the slowest league instead of the sum of all three.
+
+    Work is submitted along with the URL of the page it requests, which is
+    used to route the work to the correct host's pool. The work itself can be
+    any callable, such as the ``Boxscore`` class, which allows the page to be
+    both downloaded and parsed in the worker thread.
+
+    Parameters
+    ----------
+    workers_per_host : int (optional)
+        The number of requests to a single host which can be in progress at
+        the same time. Defaults to the burst size of the rate limiter as any
+        additional workers would only wait on the host's token bucket.
+    """
+
+    def __init__(self, workers_per_host=REQUESTS_BURST):
+        self._workers_per_host = workers_per_host
+        self._executors = {}
+        self._lock = threading.Lock()
+
+    def _executor(self, url):
+        """
+        Get the pool of worker threads for the host of a URL.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page.
+
+        Returns
+        -------
+        ThreadPoolExecutor instance
+            Returns the ``ThreadPoolExecutor`` dedicated to the URL's host.
+        """
+        host = _host(url)
+        with self._lock:
+            if host not in self._executors:
+                self._executors[host] = ThreadPoolExecutor(
+                    max_workers=self._workers_per_host,
+                    thread_name_prefix=host,
+                    initializer=_mark_worker,
+                    initargs=(host,),
+                )
+            return self._executors[host]
+
+    def submit(self, url, func=None, *args, **kwargs):
+        """
+        Schedule a request for a page.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page, which determines the host's pool
+            the work runs in.
+        func : callable (optional)
+            The function to run in the worker thread with the given arguments.
+            If left empty, the page is downloaded with
+            ``utils._rate_limit_pq`` and the PyQuery object is the result.
+
+        Returns
+        -------
+        Future instance
+            Returns a ``concurrent.futures.Future`` which resolves to the
+            result of the work once it completes.
+        """
+        if func is None:
+            func, args, kwargs = utils._rate_limit_pq, (url,), {}
+        # Work submitted from one of the host's own workers, such as a roster
+        # requesting its players while the roster itself is being built by
+        # the pool, runs immediately in the same thread. Waiting on the pool
+        # instead could block forever once every worker is waiting.
+        if getattr(_worker, "host", None) == _host(url):
+            future = Future()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as exception:
+                future.set_exception(exception)
+            return future
+        return self._executor(url).submit(func, *args, **kwargs)
+
+    def map(self, func, items, urls):
+        """
+        Run a function over a batch of items concurrently.
+
+        Parameters
+        ----------
+        func : callable
+            The function to call with every item, such as ``Boxscore`` to
+            create a ``Boxscore`` instance for every URI.
+        items : list
+            A ``list`` of the single argument to pass to each call.
+        urls : list or string
+            The URL of the page requested for each item, or a single URL if
+            every item requests a page from the same host.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of the results in the same order as the items.
+        """
+        if isinstance(urls, str):
+            urls = [urls] * len(items)
+        futures = [self.submit(url, func, item) for item, url in zip(items, urls)]
+        return [future.result() for future in futures]
+
+    def as_completed(self, func, items, urls):
+        """
+        Run a function over a batch of items concurrently, yielding each
+        result as soon as it completes.
+
+        Unlike ``map``, the results are returned in the order the work
+        finishes, which allows each result to be used while the rest of the
+        batch is still in progress. Any work which hasn't started yet is
+        cancelled if the generator is closed before it is exhausted.
+
+        Parameters
+        ----------
+        func : callable
+            The function to call with every item.
+        items : list
+            A ``list`` of the single argument to pass to each call.
+        urls : list or string
+            The URL of the page requested for each item, or a single URL if
+            every item requests a page from the same host.
+
+        Yields
+        ------
+        tuple
+            Yields a ``tuple`` of the item and the result of its call.
+        """
+        if isinstance(urls, str):
+            urls = [urls] * len(items)
+        futures = {self.submit(url, func, item): item for item, url in zip(items, urls)}
+        try:
+            for future in as_completed(list(futures)):
+                # Drop each finished future once it's yielded so its result
+                # can be released as soon as the caller is done with it.
+                yield futures.pop(future), future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def fetch(self, urls):
+        """
+        Download a batch of pages concurrently.
+
+        Parameters
+        ----------
+        urls : list
+            A ``list`` of the URLs of the requested pages.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of PyQuery objects in the same order as the
+            URLs.
+        """
+        futures = [self.submit(url) for url in urls]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """
+        Stop all worker threads once any pending work completes.
+        """
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors = {}
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """
+    Get the scheduler shared by the entire process.
+
+    Returns
+    -------
+    FetchScheduler instance
+        Returns the ``FetchScheduler`` used for all batch requests.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FetchScheduler()
+        return _scheduler
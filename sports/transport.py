@@ -0,0 +1,216 @@
+import codecs
+import re
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .constants import (
+    REQUEST_BACKOFF,
+    REQUEST_RETRIES,
+    REQUEST_TIMEOUT,
+    REQUESTS_BURST,
+)
+
+# Status codes which indicate the request should be tried again after waiting,
+# such as when the site is temporarily unavailable or has rate limited the
+# request.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# Matches the character set a page declares in a <meta> tag, either as
+# <meta charset="utf-8"> or as part of a 'Content-Type' <meta> tag.
+META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter which applies a default timeout to every request.
+
+    A ``requests.Session`` has no default timeout, so the timeout is added to
+    any request which doesn't explicitly set its own.
+
+    Parameters
+    ----------
+    timeout : float or tuple
+        The number of seconds to wait for the response, or a ``tuple`` of the
+        connect and read timeouts.
+    """
+
+    def __init__(self, timeout, *args, **kwargs):
+        self._timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, **kwargs)
+
+
+class Transport:
+    """
+    Download pages over a pooled, keep-alive HTTP session.
+
+    All requests share a single ``requests.Session`` whose connections are
+    kept open and reused, so the DNS lookup and TLS handshake for a site only
+    happen once instead of on every request. Responses are compressed with
+    gzip, and requests which are dropped mid-response are retried with an
+    exponential backoff. A site which can't be reached at all, such as when
+    offline, fails immediately instead of waiting through every retry. Pages
+    whose response doesn't include a charset are decoded with the encoding
+    the page declares itself.
+
+    Requests which fail due to a server error or were rate limited aren't
+    retried by the transport, as every retry needs to wait for the site's rate
+    limit. Those are retried by ``utils._download_page`` instead.
+
+    Parameters
+    ----------
+    timeout : float or tuple (optional)
+        The number of seconds to wait for a response, or a ``tuple`` of the
+        connect and read timeouts.
+    retries : int (optional)
+        The maximum number of times a dropped request is retried.
+    backoff_factor : float (optional)
+        The number of seconds to wait before the first retry, which doubles
+        for every subsequent retry.
+    pool_size : int (optional)
+        The maximum number of connections kept open to a single host. Defaults
+        to the number of requests which can be sent to a host concurrently.
+    """
+
+    def __init__(
+        self,
+        timeout=REQUEST_TIMEOUT,
+        retries=REQUEST_RETRIES,
+        backoff_factor=REQUEST_BACKOFF,
+        pool_size=REQUESTS_BURST,
+    ):
+        retry = Retry(
+            total=retries,
+            connect=0,
+            status=0,
+            backoff_factor=backoff_factor,
+            raise_on_status=False,
+        )
+        adapter = _TimeoutAdapter(
+            timeout, max_retries=retry, pool_maxsize=pool_size, pool_block=True
+        )
+        self._session = requests.Session()
+        self._session.headers["Accept-Encoding"] = "gzip, deflate"
+        self._session.hooks["response"].append(_set_page_encoding)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def get(self, url):
+        """
+        Send a GET request.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page.
+
+        Returns
+        -------
+        Response instance
+            Returns the ``requests.Response`` of the final attempt.
+        """
+        return self._session.get(url)
+
+    def head(self, url):
+        """
+        Send a HEAD request.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page.
+
+        Returns
+        -------
+        Response instance
+            Returns the ``requests.Response`` of the final attempt.
+        """
+        return self._session.head(url)
+
+    def close(self):
+        """
+        Close all open connections.
+        """
+        self._session.close()
+
+
+def _set_page_encoding(response, *args, **kwargs):
+    """
+    Decode a page with the encoding the page declares itself.
+
+    Without a charset in the 'Content-Type' header, requests decodes the page
+    as ISO-8859-1, which garbles any non-ASCII names. The encoding declared by
+    the page's <meta> tag is used instead if it declares a valid one,
+    otherwise the encoding is detected from the page's contents.
+
+    Parameters
+    ----------
+    response : Response instance
+        The ``requests.Response`` of the page.
+    """
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        return
+    match = META_CHARSET.search(response.content[:4096])
+    if match:
+        encoding = match.group(1).decode("ascii")
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            pass
+        else:
+            response.encoding = encoding
+            return
+    response.encoding = response.apparent_encoding
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """
+    Get the transport used for all requests.
+
+    Returns
+    -------
+    Transport instance
+        Returns the active transport, creating a ``Transport`` with the
+        default settings if none has been set.
+    """
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = Transport()
+        return _transport
+
+
+def set_transport(transport):
+    """
+    Replace the transport used for all requests.
+
+    The transport can be a ``Transport`` with custom timeouts or retries, or
+    any object with ``get`` and ``head`` methods which accept a URL and return
+    an object with the ``status_code``, ``reason``, ``headers``, and ``text``
+    attributes of a ``requests.Response``.
+
+    Parameters
+    ----------
+    transport : Transport instance
+        The transport to use for all subsequent requests. Pass None to return
+        to the default transport.
+
+    Returns
+    -------
+    Transport instance
+        Returns the previously active transport, or None if the default
+        transport was never created.
+    """
+    global _transport
+    with _transport_lock:
+        previous = _transport
+        _transport = transport
+        return previous
@@ -1,10 +1,18 @@
 import re
-import requests
+import threading
+import time
 from datetime import datetime
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
-import time
-from .constants import REQUESTS_PER_MINUTE
+from pyquery.text import extract_text
+from urllib.error import HTTPError
+from . import cache, rate_limiter, transport
+from .constants import (
+    REQUEST_BACKOFF,
+    REQUEST_MAX_BACKOFF,
+    REQUEST_RETRIES,
+    REQUESTS_PER_MINUTE,
+)
 
 
 # {
@@ -25,20 +33,199 @@ SEASON_START_MONTH = {
     "nhl": {"start": 10, "wrap": True},
 }
 
+# {
+#   site: league name - the portion of a URL which identifies pages that
+#                       follow the calendar of the league as listed in
+#                       SEASON_START_MONTH.
+# }
+SITE_LEAGUES = {
+    "baseball-reference.com": "mlb",
+    "basketball-reference.com": "nba",
+    "sports-reference.com/cbb": "ncaab",
+    "sports-reference.com/cfb": "ncaaf",
+    "pro-football-reference.com": "nfl",
+    "hockey-reference.com": "nhl",
+}
+
+# Matches parsing schemes which select table cells by their 'data-stat'
+# attribute, such as 'td[data-stat="wins"]' or 'th[data-stat="player"]:first'.
+# Fields using these schemes are read from the index built by _data_stat_index
+# instead of running a new CSS selection for every field.
+DATA_STAT_SCHEME = re.compile(r'^(td|th)\[data-stat="([^"]*)"\](:first)?$')
+
+
+def _is_url(pq_input):
+    """
+    Determine if the input to a PyQuery object is a URL.
+
+    Parameters
+    ----------
+    pq_input : string
+        A string of either a URL or the contents of a document.
+
+    Returns
+    -------
+    bool
+        Evaluates to True when the input is an HTTP or HTTPS URL, otherwise
+        returns False.
+    """
+    return str(pq_input).split("://", 1)[0] in ("http", "https")
+
+
+def _page_expires(url):
+    """
+    Determine if the contents of a page are able to change.
+
+    Pages tied to a season which has already concluded, such as the boxscore
+    of a game played years ago, never change and can be cached indefinitely.
+    The season is determined by the first 4-digit year embedded in the URL,
+    such as '2017' in '/boxscores/201710310LAL.html'. Pages which can't be
+    tied to a season, such as a player's career stats, or pages belonging to
+    the current season are treated as being able to change.
+
+    Parameters
+    ----------
+    url : string
+        The URL of the requested page.
+
+    Returns
+    -------
+    bool
+        Evaluates to False when the page belongs to a completed season,
+        otherwise returns True.
+    """
+    league = None
+    for site, site_league in SITE_LEAGUES.items():
+        if site in url:
+            league = site_league
+            break
+    year = re.search(r"(?<![0-9])((?:18|19|20)[0-9]{2})", url)
+    if not league or not year:
+        return True
+    season = _find_year_for_season(league)
+    # Games in a season which spans multiple calendar years can take place in
+    # the year prior to the season's year, such as a game in December 2017
+    # belonging to the 2018 NBA season.
+    if SEASON_START_MONTH[league]["wrap"]:
+        season -= 1
+    return int(year.group(1)) >= season
+
+
+def _retry_delay(response, attempt):
+    """
+    Find the number of seconds to wait before retrying a failed request.
+
+    Parameters
+    ----------
+    response : Response instance
+        The response of the failed request.
+    attempt : int
+        The number of the failed attempt, starting at 0 for the first request.
+
+    Returns
+    -------
+    float
+        Returns the number of seconds requested by the site's 'Retry-After'
+        header if it was sent, otherwise the wait doubles with every attempt.
+        The wait is never longer than REQUEST_MAX_BACKOFF seconds so a site
+        requesting a long wait can't block the host's requests indefinitely.
+    """
+    try:
+        delay = max(float(response.headers["Retry-After"]), 0)
+    except (KeyError, TypeError, ValueError):
+        delay = REQUEST_BACKOFF * 2**attempt
+    return min(delay, REQUEST_MAX_BACKOFF)
+
+
+def _download_page(url, requests_per_minute=REQUESTS_PER_MINUTE):
+    """
+    Download the HTML contents of a page.
+
+    The page is requested with the shared transport, which reuses open
+    connections to the site. Requests which failed due to a temporary server
+    error or were rate limited are retried with an exponential backoff. Every
+    attempt, including the retries, waits for the host's rate limit so a site
+    which is struggling never receives more requests than the limit allows.
+
+    Parameters
+    ----------
+    url : string
+        The URL of the requested page.
+    requests_per_minute : int (optional)
+        The number of requests allowed per minute for the URL's host.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the page's HTML contents.
+
+    Raises
+    ------
+    HTTPError
+        If the page returns a non-successful status code.
+    """
+    for attempt in range(REQUEST_RETRIES + 1):
+        rate_limiter.acquire(url, requests_per_minute)
+        response = transport.get_transport().get(url)
+        if response.status_code not in transport.RETRY_STATUS_CODES:
+            break
+        if attempt < REQUEST_RETRIES:
+            time.sleep(_retry_delay(response, attempt))
+    if not 200 <= response.status_code < 300:
+        raise HTTPError(
+            url, response.status_code, response.reason, response.headers, None
+        )
+    return response.text
+
+
+def _parse_page(contents):
+    """
+    Create a PyQuery object from a downloaded page with comments removed.
+
+    The comment tags are removed from the raw HTML before it is parsed for the
+    first time. The returned object is marked so ``_uncommented_page`` and
+    ``_get_stats_table`` know the comments have already been removed and can
+    use the page as-is.
+
+    Parameters
+    ----------
+    contents : string
+        A ``string`` of the page's HTML contents.
+
+    Returns
+    -------
+    PyQuery object
+        Returns a PyQuery object of the page without any comment tags.
+    """
+    doc = pq(contents.replace("<!--", "").replace("-->", ""), parser="html")
+    doc._comments_removed = True
+    return doc
+
 
 def _rate_limit_pq(pq_input, requests_per_minute=REQUESTS_PER_MINUTE):
     """
     Get a pyquery object
 
-    Creates a pyquery object then waits a specified amount of time before
-    returning. This is done to accomodate the new rate limits sports-reference
-    now enforces (https://www.sports-reference.com/bot-traffic.html)
+    Creates a pyquery object while limiting the rate of requests sent to each
+    host. This is done to accomodate the new rate limits sports-reference now
+    enforces (https://www.sports-reference.com/bot-traffic.html)
+
+    Every host has its own token bucket which allows a short burst of requests
+    to be sent immediately and only waits once the host's budget has been
+    used. Pages read from the page cache or passed in directly as a document
+    don't count against the budget.
+
+    All comment tags are removed from downloaded pages before they are parsed,
+    so tables which sports-reference embeds in comments can be read directly
+    without serializing and parsing the page again.
 
     Parameters
     ----------
     pq_input: string
         A string that contains a URL used to create a pyquery object. This
         can also be a path to a document (if needed offline integration testing).
+    requests_per_minute : int (optional)
+        The number of requests allowed per minute for the URL's host.
 
     Returns
     -------
@@ -47,9 +234,17 @@ def _rate_limit_pq(pq_input, requests_per_minute=REQUESTS_PER_MINUTE):
 
     """
     print("_rate_limit_pq: ", pq_input)
-    ret = pq(pq_input)
-    time.sleep(60 / requests_per_minute)
-    return ret
+    if not _is_url(pq_input):
+        return pq(pq_input)
+    page_cache = cache.get_cache()
+    if page_cache:
+        contents = page_cache.get(pq_input, _page_expires(pq_input))
+        if contents is not None:
+            return _parse_page(contents)
+    contents = _download_page(pq_input, requests_per_minute)
+    if page_cache:
+        page_cache.set(pq_input, contents)
+    return _parse_page(contents)
 
 
 def _todays_date():
@@ -88,9 +283,10 @@ def _url_exists(url):
         False.
     """
     try:
-        response = requests.head(url)
+        session = transport.get_transport()
+        response = session.head(url)
         if response.status_code == 301:
-            response = requests.get(url)
+            response = session.get(url)
             if response.status_code < 400:
                 return True
             else:
@@ -155,6 +351,69 @@ def _find_year_for_season(league):
         return today.year
 
 
+# The seasons which have already been resolved by _resolve_season, keyed by
+# the league and its default season.
+_resolved_seasons = {}
+_resolved_seasons_lock = threading.Lock()
+
+
+def _resolve_season(league, create_url):
+    """
+    Find the most recent season which has stats available.
+
+    Stats for the season returned by ``_find_year_for_season`` don't exist
+    until shortly before the season begins, in which case the previous season
+    should be used instead. The page for the default season is downloaded and,
+    if the site reports it doesn't exist (404), the previous season's page is
+    downloaded instead. The downloaded page is returned alongside the year so
+    it doesn't need to be pulled again by the caller.
+
+    The result is saved for the remainder of the process, so subsequent calls
+    for the same league, such as for the roster or schedule of every team,
+    return the season without sending any requests. Any other failure, such as
+    a timeout or a server error, is raised instead of being mistaken for a
+    missing season.
+
+    Parameters
+    ----------
+    league : string
+        A string pertaining to the league start information as listed in
+        SEASON_START_MONTH (ie. 'mlb', 'nba', 'nfl', etc.).
+    create_url : function
+        A function which accepts the season's year and returns the URL of the
+        page containing the requested stats for that season.
+
+    Returns
+    -------
+    tuple
+        Returns a ``tuple`` of the season's year and the PyQuery object of the
+        season's page. The PyQuery object is None if the season was resolved
+        by a previous call, in which case the caller pulls its own page for the
+        season, or if neither season's page exists.
+
+    Raises
+    ------
+    HTTPError
+        If either season's page returns an error other than 404.
+    """
+    year = _find_year_for_season(league)
+    key = (league, year)
+    with _resolved_seasons_lock:
+        if key in _resolved_seasons:
+            return _resolved_seasons[key], None
+    for season in [year, str(int(year) - 1)]:
+        try:
+            doc = _rate_limit_pq(create_url(season))
+        except HTTPError as error:
+            if error.code != 404:
+                raise
+            continue
+        with _resolved_seasons_lock:
+            _resolved_seasons[key] = season
+        return season, doc
+    return year, None
+
+
 def _parse_abbreviation(uri_link):
     """
     Returns a team's abbreviation.
@@ -182,6 +441,60 @@ def _parse_abbreviation(uri_link):
     return abbr.upper()
 
 
+def _data_stat_index(html_data):
+    """
+    Index every table cell by its 'data-stat' attribute.
+
+    Walks every 'td' and 'th' element in the HTML a single time and groups the
+    text of each cell by its tag and 'data-stat' attribute, in the order the
+    cells appear in the document. Looking up a field is then a dictionary
+    access instead of a new CSS selection over the entire HTML.
+
+    The first matching cell under each root element, such as each row when
+    rows from multiple tables are combined, is additionally grouped under its
+    own key, matching the ':first' selector which picks the first cell per
+    root element rather than across the entire HTML.
+
+    The index is saved on the PyQuery object so it is only built once, no
+    matter how many fields are parsed from the same HTML. It is rebuilt if
+    more elements have since been added to the PyQuery object, such as when
+    rows from multiple tables are combined.
+
+    Parameters
+    ----------
+    html_data : PyQuery object
+        A PyQuery object containing one or more table rows, or an entire page.
+
+    Returns
+    -------
+    dictionary
+        Returns a ``dictionary`` where every key is a ``tuple`` of the cell's
+        tag, 'data-stat' attribute, and either None for every matching cell or
+        ':first' for only the first matching cell under each root element,
+        such as ('td', 'wins', None). Every value is a ``list`` of the text of
+        the matching cells.
+    """
+    size, index = getattr(html_data, "_data_stat_index", (None, None))
+    if size == len(html_data):
+        return index
+    index = {}
+    for root in html_data:
+        if not hasattr(root, "iter"):
+            continue
+        seen = set()
+        for element in root.iter("td", "th"):
+            stat = element.get("data-stat")
+            if stat is None:
+                continue
+            text = extract_text(element)
+            index.setdefault((element.tag, stat, None), []).append(text)
+            if (element.tag, stat) not in seen:
+                seen.add((element.tag, stat))
+                index.setdefault((element.tag, stat, ":first"), []).append(text)
+    html_data._data_stat_index = (len(html_data), index)
+    return index
+
+
 def _parse_field(
     parsing_scheme, html_data, field, index=0, strip=False, secondary_index=None
 ):
@@ -231,7 +544,12 @@ def _parse_field(
     if field == "abbreviation":
         return _parse_abbreviation(html_data)
     scheme = parsing_scheme[field]
-    if strip:
+    match = DATA_STAT_SCHEME.match(scheme) if isinstance(html_data, pq) else None
+    if match:
+        items = _data_stat_index(html_data).get(match.groups(), [])
+        if strip:
+            items = [i for i in items if i]
+    elif strip:
         items = [i.text() for i in html_data(scheme).items() if i.text()]
     else:
         items = [i.text() for i in html_data(scheme).items()]
@@ -274,6 +592,31 @@ def _remove_html_comment_tags(html):
     return str(html).replace("<!--", "").replace("-->", "")
 
 
+def _uncommented_page(html):
+    """
+    Returns a PyQuery object of the passed HTML with all comment tags removed.
+
+    Pages downloaded with ``_rate_limit_pq`` already have their comment tags
+    removed and are returned as-is. Any other HTML, such as a page read from a
+    local file, is serialized with the comment tags removed and parsed again.
+
+    Parameters
+    ----------
+    html : PyQuery object
+        A PyQuery object which contains the requested HTML page contents.
+
+    Returns
+    -------
+    PyQuery object
+        The passed HTML contents with all comment tags removed.
+    """
+    if getattr(html, "_comments_removed", False):
+        return html
+    doc = pq(_remove_html_comment_tags(html))
+    doc._comments_removed = True
+    return doc
+
+
 def _get_stats_table(html_page, div, footer=False):
     """
     Returns a generator of all rows in a requested table.
@@ -300,10 +643,17 @@ def _get_stats_table(html_page, div, footer=False):
         A generator of all row items in a given table.
     """
     stats_html = html_page(div)
-    try:
-        stats_table = pq(_remove_html_comment_tags(stats_html))
-    except (ParserError, XMLSyntaxError) as e:
-        return None
+    if getattr(html_page, "_comments_removed", False):
+        # Matches the behavior of parsing an empty selection below, which
+        # raises a ParserError when the requested table doesn't exist.
+        if not stats_html:
+            return None
+        stats_table = stats_html
+    else:
+        try:
+            stats_table = pq(_remove_html_comment_tags(stats_html))
+        except (ParserError, XMLSyntaxError) as e:
+            return None
     if footer:
         teams_list = stats_table("tfoot tr").items()
     else:
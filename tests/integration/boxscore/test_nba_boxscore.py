@@ -1,14 +1,15 @@
 import mock
 import os
+import time
 import pandas as pd
 from datetime import datetime
 from flexmock import flexmock
-from sports import utils
+from sports import registry, utils
 from sports.constants import AWAY, HOME
 from sports.nba.constants import BOXSCORE_URL, BOXSCORES_URL
 from sports.nba.boxscore import Boxscore, Boxscores
 from pyquery import PyQuery as pq
-from ..utils import read_file
+from ..utils import read_contents, read_file
 
 
 MONTH = 10
@@ -133,6 +134,22 @@ class TestNBABoxscore:
             "home": [31, 25, 37, 26],
         }
 
+    def test_downloaded_page_is_parsed_without_comments(self):
+        # Downloaded pages have their comment tags removed once before they
+        # are parsed instead of each time a table is read.
+        contents = read_contents("%s.html" % BOXSCORE, "nba", "boxscore")
+
+        with mock.patch(
+            "sports.utils._rate_limit_pq",
+            side_effect=lambda url: utils._parse_page(contents),
+        ):
+            boxscore = Boxscore(BOXSCORE)
+
+        for attribute, value in self.results.items():
+            assert getattr(boxscore, attribute) == value
+        assert len(boxscore.home_players) == len(self.boxscore.home_players)
+        pd.testing.assert_frame_equal(boxscore.dataframe, self.boxscore.dataframe)
+
     def test_invalid_url_yields_empty_class(self):
         flexmock(Boxscore).should_receive("_retrieve_html_page").and_return(None)
 
@@ -490,3 +507,63 @@ class TestNBABoxscores:
         result = Boxscores(datetime(2020, 2, 22))
 
         assert result.__repr__() == "NBA games for 2-22-2020"
+
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
+    def test_boxscores_dataframe_has_a_row_for_every_game(self, *args, **kwargs):
+        result = Boxscores(datetime(2020, 2, 22), datetime(2020, 2, 23))
+
+        df = result.dataframe
+        games = [game for day in result.games.values() for game in day]
+
+        assert len(df) == len(games)
+        assert list(df["boxscore"]) == [game["boxscore"] for game in games]
+        assert df["date"].iloc[0] == pd.Timestamp(2020, 2, 22)
+        assert df["date"].iloc[-1] == pd.Timestamp(2020, 2, 23)
+        assert "date" not in games[0]
+
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
+    def test_boxscores_search_downloads_one_page_per_day(self, mock_pq):
+        Boxscores(datetime(2020, 2, 22), datetime(2020, 2, 23))
+
+        assert mock_pq.call_count == 2
+
+    @mock.patch("sports.utils._rate_limit_pq")
+    def test_boxscores_search_saves_days_in_date_order(self, mock_pq):
+        def slow_first_day(url):
+            # Delay the first day so it's the last page to complete.
+            if url == BOXSCORES_URL % (2, 22, YEAR):
+                time.sleep(0.2)
+            return mock_pyquery(url)
+
+        mock_pq.side_effect = slow_first_day
+        result = Boxscores(datetime(2020, 2, 22), datetime(2020, 2, 23))
+        streamed = [
+            timestamp
+            for timestamp, _ in result._stream_games(
+                [datetime(2020, 2, 22), datetime(2020, 2, 23)]
+            )
+        ]
+
+        assert list(result.games) == ["2-22-2020", "2-23-2020"]
+        assert streamed == ["2-23-2020", "2-22-2020"]
+
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
+    def test_boxscores_iter_games_yields_every_day(self, *args, **kwargs):
+        start, end = datetime(2020, 2, 22), datetime(2020, 2, 23)
+
+        days = dict(Boxscores.iter_games(start, end))
+
+        assert days == Boxscores(start, end).games
+
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
+    def test_boxscores_iter_boxscores_yields_every_game(self, *args, **kwargs):
+        registry.clear()
+        flexmock(Boxscore).should_receive("_parse_game_data").and_return(None)
+        games = Boxscores(datetime(2020, 2, 22)).games["2-22-2020"]
+
+        boxscores = list(Boxscores.iter_boxscores(datetime(2020, 2, 22)))
+
+        assert sorted(boxscore._uri for boxscore in boxscores) == sorted(
+            game["boxscore"] for game in games
+        )
+        registry.clear()
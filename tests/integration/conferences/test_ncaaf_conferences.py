@@ -148,7 +148,7 @@ class TestNCAAFConferences:
         assert len(conference._teams) == 0
 
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
-    @mock.patch("requests.head", side_effect=mock_request)
+    @mock.patch("requests.Session.head", side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(2019)
 
@@ -158,7 +158,7 @@ class TestNCAAFConferences:
         assert conferences.conferences == self.conferences_result
 
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
-    @mock.patch("requests.head", side_effect=mock_request)
+    @mock.patch("requests.Session.head", side_effect=mock_request)
     def test_invalid_conference_year_reverts_to_previous_year(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(2019)
 
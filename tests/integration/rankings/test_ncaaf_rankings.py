@@ -61,7 +61,7 @@ class TestNCAAFRankings:
             rankings = Rankings("BAD")
 
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
-    @mock.patch("requests.head", side_effect=mock_request)
+    @mock.patch("requests.Session.head", side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(2018)
 
@@ -94,7 +94,7 @@ class TestCFPNCAAFRankings:
             rankings = CFPRankings("BAD")
 
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
-    @mock.patch("requests.head", side_effect=mock_request)
+    @mock.patch("requests.Session.head", side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(2018)
 
@@ -4,10 +4,10 @@ import pandas as pd
 import pytest
 from datetime import datetime
 from flexmock import flexmock
-from sports import utils
+from sports import registry, utils
 from sports.nba.roster import Player, Roster
 from sports.nba.teams import Team
-from ..utils import read_file
+from ..utils import read_contents, read_file
 
 
 YEAR = 2022
@@ -44,6 +44,7 @@ def mock_request(url):
 class TestNBAPlayer:
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
+        registry.clear()
         self.results_career = {
             "and_ones": 280,
             "assist_percentage": 34.2,
@@ -1288,6 +1289,22 @@ class TestNBAPlayer:
         frames = [df, player.dataframe]
         df1 = pd.concat(frames).drop_duplicates(keep=False)
 
+    def test_downloaded_page_is_parsed_without_comments(self, *args, **kwargs):
+        # Downloaded pages have their comment tags removed once before they
+        # are parsed instead of each time a table is read.
+        contents = read_contents("jokicni01.html", "nba", "roster")
+        registry.clear()
+
+        with mock.patch(
+            "sports.utils._rate_limit_pq",
+            side_effect=lambda url: utils._parse_page(contents),
+        ):
+            player = Player("jokicni01")
+
+        for attribute, value in self.results_career.items():
+            assert getattr(player, attribute) == value
+        pd.testing.assert_frame_equal(player.dataframe, self.player.dataframe)
+
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
     def test_nba_player_with_no_stats_handled_without_error(self, *args, **kwargs):
         player = Player("bolbo01")
@@ -1303,6 +1320,12 @@ class TestNBAPlayer:
 
 
 class TestNBARoster:
+    def setup_method(self):
+        registry.clear()
+
+    def teardown_method(self):
+        registry.clear()
+
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(YEAR)
@@ -1369,7 +1392,53 @@ class TestNBARoster:
         except AttributeError:
             pytest.fail("Roster string representation is not right!")
 
-    @mock.patch("requests.head", side_effect=mock_request)
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
+    def test_lazy_roster_only_pulls_requested_players(self, mock_pq):
+        flexmock(utils).should_receive("_find_year_for_season").and_return(YEAR)
+        roster = Roster("DEN", lazy=True)
+
+        assert len(roster.players) == 22
+        assert mock_pq.call_count == 1
+        assert roster.players[2].name == "Facundo Campazzo"
+
+        players = roster.materialize(["bolbo01", "jokicni01"])
+
+        assert all(isinstance(player, Player) for player in players)
+        assert mock_pq.call_count == 3
+        assert [player.loaded for player in roster.players[:3]] == [
+            False,
+            True,
+            False,
+        ]
+        assert roster.players[0].name == "Will Barton"
+        assert mock_pq.call_count == 3
+
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
+    def test_player_page_is_only_pulled_once(self, mock_pq):
+        first = Player("jokicni01")
+        second = Player("jokicni01")
+
+        assert mock_pq.call_count == 1
+        assert first is not second
+        assert second.name == first.name
+
+    @mock.patch("requests.Session.head", side_effect=mock_request)
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
+    def test_players_are_shared_between_rosters(self, mock_pq, *args):
+        flexmock(utils).should_receive("_find_year_for_season").and_return(YEAR)
+        first = Roster("DEN", lazy=True)
+        second = Roster("DEN", lazy=True)
+
+        jokic = first.materialize(["jokicni01"])[0]
+        other = second.materialize(["jokicni01"])[0]
+        other("2017-18")
+
+        assert mock_pq.call_count == 3
+        assert jokic is not other
+        assert jokic.season == "Career"
+        assert other.season == "2017-18"
+
+    @mock.patch("requests.Session.head", side_effect=mock_request)
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(2090)
@@ -1457,7 +1457,7 @@ class TestNFLRoster:
         ]:
             assert player in [v for k, v in roster.players.items()]
 
-    @mock.patch("requests.head", side_effect=mock_request)
+    @mock.patch("requests.Session.head", side_effect=mock_request)
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(2019)
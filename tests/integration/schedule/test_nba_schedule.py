@@ -89,6 +89,17 @@ class TestNBASchedule:
         for attribute, value in self.results.items():
             assert getattr(match_two, attribute) == value
 
+    def test_nba_schedule_returns_matches_between_dates(self):
+        matches = self.schedule.games_between(
+            datetime(2021, 10, 1), datetime(2021, 10, 25, 23, 59)
+        )
+
+        assert [match.boxscore_index for match in matches] == [
+            "202110200PHO",
+            "202110220DEN",
+            "202110250DEN",
+        ]
+
     def test_nba_schedule_dataframe_returns_dataframe(self):
         df = pd.DataFrame([self.results], index=["PHO"])
 
@@ -125,6 +136,20 @@ class TestNBASchedule:
 
         assert len(result) == NUM_GAMES_IN_SCHEDULE
 
+    def test_nba_schedule_prefetch_boxscores(self):
+        boxscores = self.schedule.prefetch_boxscores()
+        game = self.schedule[1]
+
+        assert len(boxscores) == NUM_GAMES_IN_SCHEDULE
+        assert game.boxscore is boxscores["202110220DEN"]
+
+    def test_nba_schedule_iter_boxscores(self):
+        boxscores = list(self.schedule.iter_boxscores())
+
+        assert len(boxscores) == NUM_GAMES_IN_SCHEDULE
+        assert all(isinstance(boxscore, Boxscore) for boxscore in boxscores)
+        assert all(game._boxscore_instance is None for game in self.schedule._games)
+
     def test_no_games_for_date_raises_value_error(self):
         with pytest.raises(ValueError):
             self.schedule(datetime.now())
@@ -237,7 +262,7 @@ Wed, Apr 27, 2022 - GSW"""
 
 class TestNBAScheduleInvalidError:
     @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
-    @mock.patch("requests.head", side_effect=mock_request)
+    @mock.patch("requests.Session.head", side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         results = {
             "boxscore_index": "202110220DEN",
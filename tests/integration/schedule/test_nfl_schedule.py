@@ -4,6 +4,7 @@ import pandas as pd
 import pytest
 from datetime import datetime
 from flexmock import flexmock
+from urllib.error import HTTPError
 from sports import utils
 from sports.constants import AWAY, REGULAR_SEASON, WIN
 from sports.nfl.boxscore import Boxscore
@@ -22,17 +23,10 @@ def mock_pyquery(url):
     return read_file("nwe_gamelog.html", "nfl", "schedule")
 
 
-def mock_request(url):
-    class MockRequest:
-        def __init__(self, html_contents, status_code=200):
-            self.status_code = status_code
-            self.html_contents = html_contents
-            self.text = html_contents
-
-    if str(YEAR) in url:
-        return MockRequest("good")
-    else:
-        return MockRequest("bad", status_code=404)
+def mock_pyquery_missing_season(url):
+    if "/%s/" % (YEAR + 1) in url:
+        raise HTTPError(url, 404, "Not Found", {}, None)
+    return mock_pyquery(url)
 
 
 class MockDateTime:
@@ -188,8 +182,10 @@ February 4 - PHI"""
 
 
 class TestNFLScheduleInvalidYear:
-    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
-    @mock.patch("requests.head", side_effect=mock_request)
+    def teardown_method(self):
+        utils._resolved_seasons.clear()
+
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         results = {
             "week": 2,
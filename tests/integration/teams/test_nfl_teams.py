@@ -9,6 +9,7 @@ from sports.nfl.constants import LOST_WILD_CARD, SEASON_PAGE_URL
 from sports.nfl.teams import Team, Teams
 from ..utils import read_file
 from pyquery import PyQuery as pq
+from urllib.error import HTTPError
 
 
 MONTH = 9
@@ -25,17 +26,10 @@ def mock_pyquery(url):
     return read_file("kan-2017.html", "nfl", "teams")
 
 
-def mock_request(url):
-    class MockRequest:
-        def __init__(self, html_contents, status_code=200):
-            self.status_code = status_code
-            self.html_contents = html_contents
-            self.text = html_contents
-
-    if str(YEAR) in url:
-        return MockRequest("good")
-    else:
-        return MockRequest("bad", status_code=404)
+def mock_pyquery_missing_season(url):
+    if "years/%s/" % (YEAR + 1) in url:
+        raise HTTPError(url, 404, "Not Found", {}, None)
+    return mock_pyquery(url)
 
 
 class MockDateTime:
@@ -248,8 +242,10 @@ Cleveland Browns (CLE)"""
 
 
 class TestNFLIntegrationInvalidYear:
-    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery)
-    @mock.patch("requests.head", side_effect=mock_request)
+    def teardown_method(self):
+        utils._resolved_seasons.clear()
+
+    @mock.patch("sports.utils._rate_limit_pq", side_effect=mock_pyquery_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self, *args, **kwargs):
         flexmock(utils).should_receive("_find_year_for_season").and_return(2018)
 
@@ -2,7 +2,10 @@ import os
 from pyquery import PyQuery as pq
 
 
-def read_file(filename, sport, stat_type):
+def read_contents(filename, sport, stat_type):
     filepath = os.path.join(os.path.dirname(__file__), stat_type, sport, filename)
-    file_contents = open("%s" % filepath, "r", encoding="utf8", errors="replace").read()
-    return pq(file_contents)
+    return open("%s" % filepath, "r", encoding="utf8", errors="replace").read()
+
+
+def read_file(filename, sport, stat_type):
+    return pq(read_contents(filename, sport, stat_type))
@@ -0,0 +1,91 @@
+import os
+import pytest
+import time
+from flexmock import flexmock
+from mock import patch
+from sports import cache, utils
+
+
+def mock_request(url, *args, **kwargs):
+    class MockRequest:
+        def __init__(self, html_contents, status_code=200):
+            self.status_code = status_code
+            self.reason = "Not Found"
+            self.headers = {}
+            self.text = html_contents
+
+    if "404" in url:
+        return MockRequest("This is bad", 404)
+    return MockRequest("<html><body><p>This is good</p></body></html>")
+
+
+class TestPageCache:
+    def test_missing_page_returns_none(self, tmp_path):
+        page_cache = cache.PageCache(str(tmp_path))
+
+        assert page_cache.get("https://www.example.com/missing.html") is None
+
+    def test_saved_page_is_returned(self, tmp_path):
+        page_cache = cache.PageCache(str(tmp_path))
+        url = "https://www.example.com/page.html"
+
+        page_cache.set(url, "<p>contents</p>")
+
+        assert page_cache.get(url) == "<p>contents</p>"
+
+    def test_expired_page_returns_none(self, tmp_path):
+        page_cache = cache.PageCache(str(tmp_path), expiration=60)
+        url = "https://www.example.com/page.html"
+        page_cache.set(url, "<p>contents</p>")
+        old = time.time() - 120
+        os.utime(page_cache._path(url), (old, old))
+
+        assert page_cache.get(url) is None
+        assert page_cache.get(url, expires=False) == "<p>contents</p>"
+
+    def test_removed_page_returns_none(self, tmp_path):
+        page_cache = cache.PageCache(str(tmp_path))
+        url = "https://www.example.com/page.html"
+        page_cache.set(url, "<p>contents</p>")
+
+        page_cache.remove(url)
+        page_cache.remove(url)
+
+        assert page_cache.get(url) is None
+
+    def test_enable_and_disable_cache(self, tmp_path):
+        page_cache = cache.enable_cache(str(tmp_path))
+
+        assert cache.get_cache() is page_cache
+        assert page_cache.directory == str(tmp_path)
+
+        cache.disable_cache()
+
+        assert cache.get_cache() is None
+
+
+class TestRateLimitCache:
+    def teardown_method(self):
+        cache.disable_cache()
+
+    @patch("requests.Session.get", side_effect=mock_request)
+    def test_cached_page_is_not_downloaded_again(self, mock_get, tmp_path):
+        cache.enable_cache(str(tmp_path))
+        flexmock(utils.rate_limiter).should_receive("acquire").once()
+        url = "https://www.basketball-reference.com/boxscores/201710310LAL.html"
+
+        first = utils._rate_limit_pq(url)
+        second = utils._rate_limit_pq(url)
+
+        assert mock_get.call_count == 1
+        assert first("p").text() == second("p").text() == "This is good"
+
+    @patch("requests.Session.get", side_effect=mock_request)
+    def test_failed_page_is_not_cached(self, mock_get, tmp_path):
+        page_cache = cache.enable_cache(str(tmp_path))
+        url = "https://www.basketball-reference.com/boxscores/404.html"
+
+        with pytest.raises(utils.HTTPError):
+            utils._rate_limit_pq(url)
+
+        assert page_cache.get(url) is None
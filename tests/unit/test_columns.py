@@ -0,0 +1,115 @@
+from functools import wraps
+import pandas as pd
+from sports.columns import (
+    SeasonView,
+    constant_column,
+    rows_dataframe,
+    season_column,
+    season_columns,
+)
+
+
+def _int_property_decorator(func):
+    def value(prop, index):
+        try:
+            return int(prop[index])
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return value(func(*args), args[0]._index)
+
+    return season_column(wrapper, func, value)
+
+
+def _most_recent_decorator(func):
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        return func(*args)[-1]
+
+    return constant_column(wrapper)
+
+
+class Player:
+    def __init__(self):
+        self._index = 0
+        self._season = ["2016-17", "2017-18", "Career"]
+        self._points = ["10", "", "30"]
+        self._position = ["SG", "PG", "PG"]
+        self.reads = 0
+
+    @_int_property_decorator
+    def points(self):
+        self.reads += 1
+        return self._points
+
+    @_most_recent_decorator
+    def position(self):
+        return self._position
+
+    @property
+    def season(self):
+        return self._season[self._index]
+
+    def _dataframe_fields(self):
+        return {
+            "points": self.points,
+            "position": self.position,
+            "season": self.season,
+        }
+
+
+class TestColumns:
+    def test_every_season_is_read_at_once(self):
+        player = Player()
+
+        columns = season_columns(Player._dataframe_fields, player, [0, 1, 2])
+
+        assert columns == {
+            "points": [10, None, 30],
+            "position": ["PG", "PG", "PG"],
+            "season": ["2016-17", "2017-18", "Career"],
+        }
+        assert player.reads == 1
+
+    def test_player_index_is_not_changed(self):
+        player = Player()
+        player._index = 2
+
+        season_columns(Player._dataframe_fields, player, [0, 1])
+
+        assert player._index == 2
+        assert player.points == 30
+
+    def test_season_view_reads_requested_season(self):
+        player = Player()
+
+        view = SeasonView(player, 1)
+
+        assert view.season == "2017-18"
+        assert view._dataframe_fields()["points"] is None
+        assert player.season == "2016-17"
+
+    def test_rows_with_missing_values_match_concatenated_rows(self):
+        rows = [
+            {"name": "Purdue", "rank": None, "points": 80, "margin": 1.5},
+            {"name": "Indiana", "rank": 18, "points": 72, "margin": None},
+        ]
+        index = ["PURDUE", "INDIANA"]
+        expected = pd.concat(
+            [pd.DataFrame([row], index=[name]) for row, name in zip(rows, index)]
+        )
+
+        df = rows_dataframe(rows, index)
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert list(df["rank"]) == [None, 18]
+        assert df["points"].dtype == "int64"
+
+    def test_rows_dataframe_without_rows_is_empty(self):
+        df = rows_dataframe([], [])
+
+        assert df.empty
@@ -0,0 +1,91 @@
+import pytest
+from sports import compact
+from sports.decorators import int_property_decorator
+
+
+class Player:
+    def __init__(self, name, points, team=None):
+        self._name = name
+        self._points = points
+        self._team = team
+        self._positions = ["G"]
+
+    @property
+    def name(self):
+        return self._name
+
+    @int_property_decorator
+    def points(self):
+        return self._points
+
+    @property
+    def team(self):
+        return self._team
+
+
+class TestCompact:
+    def teardown_method(self):
+        compact.disable()
+
+    def test_compact_players_keep_properties(self):
+        players = [Player("James Harden", "30", "HOU"), Player("Chris Paul", "12")]
+
+        compacted = compact.compact(players)
+
+        assert [player.name for player in compacted] == ["James Harden", "Chris Paul"]
+        assert [player.points for player in compacted] == [30, 12]
+        assert [player.team for player in compacted] == ["HOU", None]
+        assert all(isinstance(player, Player) for player in compacted)
+
+    def test_single_element_lists_are_wrapped_again(self):
+        compacted = compact.compact([Player("James Harden", "30")])
+
+        assert compacted[0]._positions == ["G"]
+        assert "_positions" in compacted[0]._store._single
+
+    def test_compact_players_share_identical_strings(self):
+        compacted = compact.compact([Player("a", "1" * 50), Player("b", "1" * 50)])
+
+        assert compacted[0]._points is compacted[1]._points
+
+    def test_compact_players_have_no_instance_dictionary_entries(self):
+        compacted = compact.compact([Player("James Harden", "30")])
+
+        assert compacted[0].__dict__ == {}
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        compacted = compact.compact([Player("James Harden", "30")])
+
+        with pytest.raises(AttributeError):
+            compacted[0]._assists
+
+    def test_setting_attribute_only_affects_one_player(self):
+        compacted = compact.compact([Player("a", "1"), Player("b", "2")])
+
+        compacted[0]._points = "5"
+
+        assert compacted[0].points == 5
+        assert compacted[1].points == 2
+
+    def test_empty_list_is_returned_as_is(self):
+        assert compact.compact([]) == []
+        assert compact.compact(None) is None
+
+    def test_compact_class_is_only_created_once(self):
+        first = compact.compact([Player("a", "1")])
+        second = compact.compact([Player("b", "2")])
+
+        assert type(first[0]) is type(second[0])
+        assert type(first[0]).__name__ == "Player"
+
+    def test_compact_if_enabled(self):
+        players = [Player("James Harden", "30")]
+
+        assert compact.compact_if_enabled(players) is players
+
+        compact.enable()
+        compacted = compact.compact_if_enabled(players)
+
+        assert compact.is_enabled()
+        assert compacted is not players
+        assert compacted[0].points == 30
@@ -0,0 +1,66 @@
+from sports.decorators import (
+    cached_conversion,
+    float_property_decorator,
+    int_property_decorator,
+)
+
+
+class Stats:
+    def __init__(self, value):
+        self._value = value
+
+    @int_property_decorator
+    def integer(self):
+        return self._value
+
+    @float_property_decorator
+    def decimal(self):
+        return self._value
+
+
+class TestCachedConversion:
+    def test_value_is_only_converted_once(self):
+        calls = []
+
+        @cached_conversion
+        def convert(value):
+            calls.append(value)
+            return int(value)
+
+        assert convert("12") == 12
+        assert convert("12") == 12
+        assert convert("13") == 13
+        assert calls == ["12", "13"]
+
+    def test_unhashable_value_is_converted(self):
+        @cached_conversion
+        def convert(value):
+            return len(value)
+
+        assert convert([1, 2]) == 2
+
+
+class TestPropertyDecorators:
+    def test_int_property_converts_value(self):
+        assert Stats("+21").integer == 21
+        assert Stats("23-112").integer == 23
+        assert Stats(4.0).integer == 4
+
+    def test_float_property_converts_value(self):
+        assert Stats("45.5%").decimal == 45.5
+        assert Stats(2).decimal == 2.0
+
+    def test_missing_value_returns_none(self):
+        assert Stats("").integer is None
+        assert Stats(None).integer is None
+        assert Stats("").decimal is None
+        assert Stats(None).decimal is None
+
+    def test_changed_value_is_converted_again(self):
+        stats = Stats("10")
+
+        assert stats.integer == 10
+
+        stats._value = "11"
+
+        assert stats.integer == 11
@@ -56,7 +56,8 @@ class TestFBRoster:
 
         assert result == {}
 
-    @mock.patch("requests.get", side_effect=mock_httperror)
+    @mock.patch("sports.utils.time.sleep")
+    @mock.patch("requests.Session.get", side_effect=mock_httperror)
     def test_invalid_http_page_error(self, *args, **kwargs):
         flexmock(Roster).should_receive("__init__").and_return(None)
         roster = Roster(None)
@@ -65,3 +66,13 @@ class TestFBRoster:
         output = roster._pull_stats(None)
 
         assert not output
+
+    def test_player_lookup_by_name_or_player_id(self):
+        kane = MockSquadPlayer("Harry Kane", "21a66f6a")
+        lloris = MockSquadPlayer("Hugo Lloris", "8f62b6ee")
+        self.roster._players = [kane, lloris]
+
+        assert self.roster("21A66F6A") is kane
+        assert self.roster(" hugo lloris ") is lloris
+        with pytest.raises(ValueError):
+            self.roster("Son Heung-min")
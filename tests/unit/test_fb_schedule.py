@@ -168,7 +168,8 @@ class TestFBSchedule:
 
         assert output == 4
 
-    @mock.patch("requests.get", side_effect=mock_httperror)
+    @mock.patch("sports.utils.time.sleep")
+    @mock.patch("requests.Session.get", side_effect=mock_httperror)
     def test_invalid_http_page_error(self, *args, **kwargs):
         flexmock(Schedule).should_receive("__init__").and_return(None)
         schedule = Schedule(None)
@@ -1,5 +1,12 @@
 import pytest
-from sports.fb.fb_utils import _lookup_team, lookup_squad_id, _parse_squad_name
+from difflib import get_close_matches
+from sports.fb.fb_utils import (
+    _closest_squad_names,
+    _lookup_team,
+    lookup_squad_id,
+    _parse_squad_name,
+)
+from sports.fb.squad_ids import SQUAD_IDS
 
 
 class TestFBUtils:
@@ -34,3 +41,32 @@ class TestFBUtils:
     def test_team_name_lookup_no_match(self):
         with pytest.raises(ValueError):
             result = _lookup_team("noteamname")
+
+    def test_squad_lookup_ignores_accents(self):
+        assert lookup_squad_id("CA Huracan") == lookup_squad_id("CA Huracán")
+
+    def test_squad_lookup_suggests_closest_matches(self):
+        output = lookup_squad_id("Tottenham", quiet=True)
+
+        assert list(output)[0] == "Tottenham Hotspur"
+        assert output["Tottenham Hotspur"] == "361ca564"
+
+    def test_closest_matches_are_same_as_comparing_every_team(self):
+        names = [
+            "tottenham",
+            "tottenhm hotspurs",
+            "madeup city",
+            "bayern munchen",
+            "manchester utd",
+            "real madird",
+            "inter milan",
+            "psg",
+            "ac sparta prag",
+            "kf skenderbeu",
+            "x",
+            "",
+        ]
+
+        for name in names:
+            expected = get_close_matches(name, SQUAD_IDS, 5)
+            assert _closest_squad_names(name, 5) == expected
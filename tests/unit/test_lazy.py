@@ -0,0 +1,69 @@
+from sports.lazy import LazyPlayer, materialize
+
+
+class MockPlayer:
+    created = []
+
+    def __init__(self, player_id):
+        MockPlayer.created.append(player_id)
+        self.player_id = player_id
+        self.name = "Loaded %s" % player_id
+        self.points = 10
+
+    def __call__(self, requested_season):
+        self.season = requested_season
+        return self
+
+    def __str__(self):
+        return f"{self.name} ({self.player_id})"
+
+
+URL = "https://www.basketball-reference.com/teams/DEN/2022.html"
+
+
+class TestLazyPlayer:
+    def setup_method(self):
+        MockPlayer.created = []
+
+    def test_roster_fields_do_not_load_player(self):
+        player = LazyPlayer(MockPlayer, "jokicni01", "Nikola Jokic", URL)
+
+        assert player.player_id == "jokicni01"
+        assert player.name == "Nikola Jokic"
+        assert str(player) == "Nikola Jokic (jokicni01)"
+        assert not player.loaded
+        assert MockPlayer.created == []
+
+    def test_stats_load_player_once(self):
+        player = LazyPlayer(MockPlayer, "jokicni01", "Nikola Jokic", URL)
+
+        assert player.points == 10
+        assert player.points == 10
+        assert player.loaded
+        assert MockPlayer.created == ["jokicni01"]
+
+    def test_call_is_passed_to_player(self):
+        player = LazyPlayer(MockPlayer, "jokicni01", "Nikola Jokic", URL)
+
+        result = player("2021-22")
+
+        assert result.season == "2021-22"
+        assert str(player) == "Loaded jokicni01 (jokicni01)"
+
+    def test_materialize_loads_pending_players_in_order(self):
+        players = [
+            LazyPlayer(MockPlayer, "jokicni01", "Nikola Jokic", URL),
+            LazyPlayer(MockPlayer, "bolbo01", "Bol Bol", URL),
+        ]
+        loaded = MockPlayer("bartowi01")
+
+        result = materialize(players + [loaded])
+
+        assert [player.player_id for player in result] == [
+            "jokicni01",
+            "bolbo01",
+            "bartowi01",
+        ]
+        assert all(isinstance(player, MockPlayer) for player in result)
+        assert sorted(MockPlayer.created) == ["bartowi01", "bolbo01", "jokicni01"]
+        assert result[-1] is loaded
@@ -49,7 +49,7 @@ def mock_pyquery(url, *args, **kwargs):
 
 
 class TestMLBBoxscore:
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore).should_receive("_parse_game_data").and_return(None)
 
@@ -183,7 +183,7 @@ class TestMLBBoxscore:
 
         assert result == {"away": [None], "home": [None]}
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         result = Boxscore(None)._retrieve_html_page("")
 
@@ -335,7 +335,7 @@ Day Game, on grass
 
 
 class TestMLBBoxscores:
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores).should_receive("_find_games").and_return(None)
         self.boxscores = Boxscores(None)
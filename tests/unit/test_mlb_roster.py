@@ -58,7 +58,7 @@ class TestMLBPlayer:
 
         assert result is None
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_invalid_url_return_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value="BAD")
         player = Player(None)
@@ -78,7 +78,7 @@ class TestMLBPlayer:
 
         assert result == ""
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_missing_weight_returns_none(self, *args, **kwargs):
         mock_weight = PropertyMock(return_value=None)
         player = Player(None)
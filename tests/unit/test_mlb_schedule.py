@@ -149,3 +149,20 @@ class TestMLBSchedule:
         type(self.game)._games_behind = fake_games_up
 
         assert self.game.games_behind is None
+
+    def test_double_header_games_are_found_by_date(self):
+        flexmock(Schedule).should_receive("_pull_schedule").and_return(None)
+        schedule = Schedule("HOU")
+        first = flexmock(datetime=datetime(2022, 7, 20), game_number_for_day=1)
+        second = flexmock(datetime=datetime(2022, 7, 21), game_number_for_day=1)
+        third = flexmock(datetime=datetime(2022, 7, 21), game_number_for_day=2)
+        schedule._games = [first, second, third]
+
+        assert schedule(datetime(2022, 7, 21)) is second
+        assert schedule(datetime(2022, 7, 21, 19, 10), 2) is third
+        assert schedule.games_between(datetime(2022, 7, 21), datetime(2022, 7, 31)) == [
+            second,
+            third,
+        ]
+        with pytest.raises(ValueError):
+            schedule(datetime(2022, 7, 20), 2)
@@ -57,7 +57,7 @@ class TestNBAPlayer:
 
         assert result is None
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value="BAD")
         player = Player(None)
@@ -92,7 +92,7 @@ class TestNBAPlayer:
 
         assert player._contract is None
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_missing_weight_returns_none(self, *args, **kwargs):
         mock_weight = PropertyMock(return_value=None)
         player = Player(None)
@@ -100,6 +100,22 @@ class TestNBAPlayer:
 
         assert not player.weight
 
+    def test_season_position_uses_index(self):
+        player = Player(None)
+        player._season = ["2017-18", "2018-19", "Career"]
+
+        assert player._season_position("2018-19") == 1
+        assert player._season_position("Career") == 2
+        assert player._season_position("2010-11") is None
+
+    def test_season_index_is_rebuilt_for_new_seasons(self):
+        player = Player(None)
+        player._season = ["2017-18", "Career"]
+        player._season_position("Career")
+        player._season = ["Career"]
+
+        assert player._season_position("Career") == 0
+
 
 class TestInvalidNBAPlayer:
     def test_no_player_data_returns_no_stats(self):
@@ -1,6 +1,8 @@
 from flexmock import flexmock
 from mock import PropertyMock
+from sports import registry
 from sports.constants import AWAY, HOME, LOSS, WIN
+from sports.nba.boxscore import Boxscore
 from sports.nba.schedule import Game, Schedule
 
 
@@ -43,7 +45,7 @@ class TestNBASchedule:
         flexmock(Schedule).should_receive("_pull_schedule").and_return(None)
         schedule = Schedule("DET")
 
-        fake_game = flexmock(dataframe=None)
+        fake_game = flexmock(_dataframe_fields=lambda: None)
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
@@ -58,3 +60,12 @@ class TestNBASchedule:
         type(schedule).__iter__ = fake_games
 
         assert schedule.dataframe_extended is None
+
+    def test_boxscore_is_only_created_once(self):
+        self.game._boxscore = "201710310LAL"
+        flexmock(registry).should_receive("get_boxscore").with_args(
+            "nba", "201710310LAL", Boxscore
+        ).and_return("boxscore").once()
+
+        assert self.game.boxscore == "boxscore"
+        assert self.game.boxscore == "boxscore"
@@ -1,6 +1,12 @@
+import pytest
+import pandas as pd
+import threading
+import time
 from flexmock import flexmock
+from sports.nba.roster import Roster
 from sports.nba.schedule import Schedule
-from sports.nba.teams import Team
+from sports.nba import teams as teams_module
+from sports.nba.teams import Team, Teams
 
 
 class TestNBATeams:
@@ -11,3 +17,123 @@ class TestNBATeams:
         team = Team(None, 1)
 
         assert len(team.schedule) == 0
+
+    def test_nba_schedule_and_roster_are_only_created_once(self, *args, **kwargs):
+        flexmock(Team).should_receive("_parse_team_data").and_return(None)
+        flexmock(Schedule).should_receive("_pull_schedule").and_return(None)
+        flexmock(Roster).should_receive("__init__").and_return(None).once()
+
+        team = Team(None, 1)
+        schedule = team.schedule
+
+        assert team.schedule is schedule
+        assert team.roster is team.roster
+
+        team.clear_cache()
+
+        assert team.schedule is not schedule
+
+    def test_nba_roster_is_only_created_once_across_threads(self, *args, **kwargs):
+        flexmock(Team).should_receive("_parse_team_data").and_return(None)
+        created = []
+
+        def create_roster(*args, **kwargs):
+            created.append(args)
+            time.sleep(0.05)
+
+        flexmock(Roster).should_receive("__init__").replace_with(create_roster)
+        team = Team(None, 1)
+        rosters = []
+        threads = [
+            threading.Thread(target=lambda: rosters.append(team.roster))
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert len(rosters) == 4
+        assert all(roster is rosters[0] for roster in rosters)
+
+    def test_nba_teams_dataframes_built_in_single_call(self, *args, **kwargs):
+        flexmock(teams_module).should_receive("_retrieve_all_teams").and_return(
+            ({}, 2022)
+        )
+        teams = Teams()
+        first = flexmock(_abbreviation="DEN", _dataframe_fields=lambda: {"wins": 48})
+        second = flexmock(_abbreviation="LAL", _dataframe_fields=lambda: {"wins": 33})
+        teams._teams = [first, second]
+        flexmock(pd).should_receive("concat").never()
+
+        df = teams.dataframes
+
+        assert list(df.index) == ["DEN", "LAL"]
+        assert list(df["wins"]) == [48, 33]
+
+    def test_nba_teams_lookup_uses_index(self, *args, **kwargs):
+        flexmock(teams_module).should_receive("_retrieve_all_teams").and_return(
+            ({}, 2022)
+        )
+        teams = Teams()
+        denver = flexmock(abbreviation="DEN", name="Denver Nuggets")
+        lakers = flexmock(abbreviation="LAL", name="Los Angeles Lakers")
+        teams._teams = [denver, lakers]
+
+        assert teams["den"] is denver
+        assert teams("LAL") is lakers
+        assert teams["Los Angeles Lakers"] is lakers
+        with pytest.raises(ValueError):
+            teams["BOS"]
+
+    def test_nba_teams_prefetch_schedules_and_rosters(self, *args, **kwargs):
+        flexmock(teams_module).should_receive("_retrieve_all_teams").and_return(
+            ({}, 2022)
+        )
+        teams = Teams()
+        denver = flexmock(abbreviation="DEN", schedule="den games", roster="den")
+        lakers = flexmock(abbreviation="LAL", schedule="lal games", roster="lal")
+        teams._teams = [denver, lakers]
+
+        schedules = teams.prefetch_schedules()
+        rosters = teams.prefetch_rosters()
+
+        assert schedules == {"DEN": "den games", "LAL": "lal games"}
+        assert rosters == {"DEN": "den", "LAL": "lal"}
+
+    def test_nba_teams_boxscores_are_only_pulled_once(self, *args, **kwargs):
+        flexmock(teams_module).should_receive("_retrieve_all_teams").and_return(
+            ({}, 2022)
+        )
+        teams = Teams()
+        boxscore = flexmock(dataframe=pd.DataFrame([{"pace": 98.2}]))
+        home = flexmock(_result="Win", boxscore_index="202110220DEN", boxscore=boxscore)
+        # The other team's game has no boxscore of its own to download.
+        away = flexmock(_result="Loss", boxscore_index="202110220DEN")
+        unplayed = flexmock(_result=None, boxscore_index=None)
+        denver = flexmock(abbreviation="DEN", schedule=flexmock(_games=[home]))
+        spurs = flexmock(abbreviation="SAS", schedule=flexmock(_games=[away, unplayed]))
+        teams._teams = [denver, spurs]
+
+        boxscores = teams.prefetch_boxscores()
+        df = teams.dataframe_extended
+
+        assert boxscores == {"202110220DEN": boxscore}
+        assert away._boxscore_instance is boxscore
+        assert len(df) == 1
+
+    def test_nba_teams_dataframes_keep_missing_values(self, *args, **kwargs):
+        flexmock(teams_module).should_receive("_retrieve_all_teams").and_return(
+            ({}, 2022)
+        )
+        teams = Teams()
+        first = flexmock(_abbreviation="DEN", _dataframe_fields=lambda: {"wins": 48})
+        second = flexmock(_abbreviation="LAL", _dataframe_fields=lambda: {"wins": None})
+        teams._teams = [first, second]
+
+        df = teams.dataframes
+
+        assert list(df["wins"]) == [48, None]
+        assert df["wins"].dtype == object
@@ -50,7 +50,7 @@ def mock_pyquery(url, *args, **kwargs):
 
 
 class TestNCAAFBoxscore:
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore).should_receive("_parse_game_data").and_return(None)
 
@@ -402,7 +402,7 @@ Logos via Sports Logos.net / About logos
 
 
 class TestNCAABBoxscores:
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores).should_receive("_find_games").and_return(None)
         self.boxscores = Boxscores(None)
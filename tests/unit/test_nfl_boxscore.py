@@ -58,7 +58,7 @@ def mock_pyquery(url, status_code=404, *args, **kwargs):
 
 
 class TestNFLBoxscore:
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore).should_receive("_parse_game_data").and_return(None)
 
@@ -180,7 +180,7 @@ class TestNFLBoxscore:
 
         assert result == {"away": [None], "home": [None]}
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         result = Boxscore(None)._retrieve_html_page("bad")
 
@@ -338,7 +338,7 @@ itemprop="name">New England Patriots</a>'
 
 
 class TestNFLBoxscores:
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores).should_receive("_find_games").and_return(None)
         self.boxscores = Boxscores(None, None)
@@ -23,7 +23,7 @@ class TestNFLPlayer:
         flexmock(Player).should_receive("_pull_player_data").and_return(None)
         flexmock(Player).should_receive("_find_initial_index").and_return(None)
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value="BAD")
         player = Player(None)
@@ -33,7 +33,7 @@ class TestNFLPlayer:
 
         assert result is None
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_missing_weight_returns_none(self, *args, **kwargs):
         mock_weight = PropertyMock(return_value=None)
         player = Player(None)
@@ -41,7 +41,7 @@ class TestNFLPlayer:
 
         assert not player.weight
 
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test_requesting_detailed_season_returns_proper_index(self, *args, **kwargs):
         mock_detailed_seasons = PropertyMock(return_value=["2017", "2018", "Career"])
         mock_seasons = PropertyMock(
@@ -231,7 +231,7 @@ class TestNHLSchedule:
         flexmock(Schedule).should_receive("_pull_schedule").and_return(None)
         schedule = Schedule("DET")
 
-        fake_game = flexmock(dataframe=None)
+        fake_game = flexmock(_dataframe_fields=lambda: None)
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
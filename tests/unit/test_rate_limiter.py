@@ -0,0 +1,82 @@
+from flexmock import flexmock
+from sports import rate_limiter
+
+
+class TestTokenBucket:
+    def setup_method(self):
+        self.now = 1000.0
+        flexmock(rate_limiter.time).should_receive("monotonic").replace_with(
+            lambda: self.now
+        )
+
+    def test_burst_is_not_delayed(self):
+        flexmock(rate_limiter.time).should_receive("sleep").never()
+        bucket = rate_limiter.TokenBucket(requests_per_minute=60, burst=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0, 0, 0]
+
+    def test_request_over_budget_waits_for_refill(self):
+        flexmock(rate_limiter.time).should_receive("sleep").with_args(1.0).once()
+        bucket = rate_limiter.TokenBucket(requests_per_minute=60, burst=1)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 1.0
+
+    def test_waiting_requests_are_spaced_out(self):
+        flexmock(rate_limiter.time).should_receive("sleep")
+        bucket = rate_limiter.TokenBucket(requests_per_minute=60, burst=1)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits == [0, 1.0, 2.0, 3.0]
+
+    def test_bucket_refills_over_time(self):
+        flexmock(rate_limiter.time).should_receive("sleep").never()
+        bucket = rate_limiter.TokenBucket(requests_per_minute=60, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        self.now += 2
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+
+    def test_changing_rate_keeps_refilled_tokens(self):
+        flexmock(rate_limiter.time).should_receive("sleep")
+        bucket = rate_limiter.TokenBucket(requests_per_minute=60, burst=1)
+        bucket.acquire()
+
+        self.now += 0.5
+        bucket.set_rate(30)
+
+        assert bucket.requests_per_minute == 30
+        assert bucket.acquire() == 1.0
+
+
+class TestHostBuckets:
+    def setup_method(self):
+        rate_limiter.reset()
+
+    def teardown_method(self):
+        rate_limiter.reset()
+
+    def test_same_host_shares_bucket(self):
+        first = rate_limiter.get_bucket("http://www.basketball-reference.com/a.html")
+        second = rate_limiter.get_bucket("https://basketball-reference.com/b.html")
+
+        assert first is second
+
+    def test_different_hosts_have_separate_buckets(self):
+        first = rate_limiter.get_bucket("https://www.basketball-reference.com/a")
+        second = rate_limiter.get_bucket("https://fbref.com/en/squads/a")
+
+        assert first is not second
+
+    def test_bucket_rate_follows_requested_rate(self):
+        url = "https://www.basketball-reference.com/a.html"
+        bucket = rate_limiter.get_bucket(url, requests_per_minute=20)
+
+        assert rate_limiter.get_bucket(url, requests_per_minute=10) is bucket
+        assert bucket.requests_per_minute == 10
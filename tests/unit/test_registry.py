@@ -0,0 +1,200 @@
+import threading
+import pytest
+from flexmock import flexmock
+from sports import registry
+
+PLAYER_URL = "https://www.basketball-reference.com/players/h/hardeja01.html"
+
+
+class Boxscore:
+    def __init__(self, uri):
+        self.uri = uri
+
+
+class TestRegistry:
+    def test_instance_is_only_created_once(self):
+        shared = registry.Registry()
+        created = []
+
+        def factory():
+            created.append(1)
+            return object()
+
+        first = shared.get("key", factory)
+        second = shared.get("key", factory)
+
+        assert first is second
+        assert len(created) == 1
+        assert "key" in shared
+
+    def test_least_recently_used_instance_is_dropped(self):
+        shared = registry.Registry(max_size=2)
+        shared.set("a", 1)
+        shared.set("b", 2)
+        shared.get("a", lambda: None)
+
+        shared.set("c", 3)
+
+        assert "a" in shared
+        assert "b" not in shared
+        assert len(shared) == 2
+
+    def test_failed_instance_is_not_registered(self):
+        shared = registry.Registry()
+
+        def fail():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            shared.get("key", fail)
+
+        assert "key" not in shared
+        assert shared.get("key", lambda: 1) == 1
+
+    def test_concurrent_requests_share_one_instance(self):
+        shared = registry.Registry()
+        started = threading.Event()
+        release = threading.Event()
+        created = []
+        results = []
+
+        def factory():
+            created.append(1)
+            started.set()
+            release.wait(5)
+            return object()
+
+        first = threading.Thread(
+            target=lambda: results.append(shared.get("k", factory))
+        )
+        first.start()
+        started.wait(5)
+        second = threading.Thread(
+            target=lambda: results.append(shared.get("k", factory))
+        )
+        second.start()
+        release.set()
+        first.join()
+        second.join()
+
+        assert len(created) == 1
+        assert results[0] is results[1]
+
+    def test_request_while_registering_shares_instance(self):
+        shared = registry.Registry()
+        store = shared._store
+        created = []
+        results = []
+
+        def factory():
+            created.append(1)
+            return object()
+
+        def store_while_requested(key, instance, expires):
+            request = threading.Thread(
+                target=lambda: results.append(shared.get(key, factory))
+            )
+            request.start()
+            request.join(0.1)
+            store(key, instance, expires)
+            self.request = request
+
+        shared._store = store_while_requested
+        instance = shared.get("k", factory)
+        self.request.join(5)
+
+        assert len(created) == 1
+        assert results == [instance]
+
+    def test_instance_is_created_again_once_expired(self):
+        shared = registry.Registry(expiration=60)
+        now = [100]
+        flexmock(registry.time).should_receive("monotonic").replace_with(lambda: now[0])
+        first = shared.get("key", object)
+
+        now[0] = 159
+        assert shared.get("key", object) is first
+
+        now[0] = 160
+        assert "key" not in shared
+        assert shared.get("key", object) is not first
+
+    def test_instance_which_cant_change_does_not_expire(self):
+        shared = registry.Registry(expiration=60)
+        now = [100]
+        flexmock(registry.time).should_receive("monotonic").replace_with(lambda: now[0])
+        first = shared.get("key", object, expires=False)
+
+        now[0] = 10000
+
+        assert shared.get("key", object) is first
+
+    def test_remove_and_clear(self):
+        shared = registry.Registry()
+        shared.set("a", 1)
+        shared.set("b", 2)
+
+        shared.remove("a")
+
+        assert "a" not in shared
+
+        shared.clear()
+
+        assert len(shared) == 0
+
+
+class TestGetBoxscore:
+    def teardown_method(self):
+        registry.clear()
+
+    def test_boxscore_is_shared_by_uri(self):
+        first = registry.get_boxscore("nba", "201710310LAL", Boxscore)
+        second = registry.get_boxscore("nba", "201710310LAL", Boxscore)
+        other = registry.get_boxscore("nhl", "201710310LAL", Boxscore)
+
+        assert first is second
+        assert first is not other
+
+    def test_unplayed_game_is_not_shared(self):
+        first = registry.get_boxscore("nba", None, lambda uri: object())
+        second = registry.get_boxscore("nba", None, lambda uri: object())
+
+        assert first is not second
+
+
+class TestGetPlayer:
+    def teardown_method(self):
+        registry.clear()
+
+    def test_player_is_shared_by_league_and_id(self):
+        first = get_player("nba", "hardeja01", lambda: {"_index": 0})
+        second = get_player("nba", "hardeja01", lambda: {"_index": 1})
+        other = get_player("nhl", "hardeja01", lambda: {"_index": 2})
+
+        assert first is second
+        assert other == {"_index": 2}
+
+    def test_clear_removes_players(self):
+        first = get_player("nba", "hardeja01", lambda: {"_index": 0})
+        registry.clear()
+        second = get_player("nba", "hardeja01", lambda: {"_index": 0})
+
+        assert first is not second
+
+    def test_player_which_could_not_be_pulled_is_not_kept(self):
+        assert get_player("nba", "hardeja01", lambda: None) is None
+        assert get_player("nba", "hardeja01", lambda: {"_index": 0}) == {"_index": 0}
+
+    def test_player_is_pulled_again_once_page_expires(self):
+        now = [100]
+        flexmock(registry.time).should_receive("monotonic").replace_with(lambda: now[0])
+        first = get_player("nba", "hardeja01", lambda: {"_index": 0})
+
+        now[0] = 100 + registry.CACHE_EXPIRATION
+        second = get_player("nba", "hardeja01", lambda: {"_index": 0})
+
+        assert first is not second
+
+
+def get_player(league, player_id, parse):
+    return registry.get_player(league, player_id, parse, lambda: PLAYER_URL)
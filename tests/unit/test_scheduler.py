@@ -0,0 +1,106 @@
+import pytest
+import threading
+from flexmock import flexmock
+from sports import scheduler, utils
+
+
+class TestFetchScheduler:
+    def setup_method(self):
+        self.scheduler = scheduler.FetchScheduler(workers_per_host=2)
+
+    def teardown_method(self):
+        self.scheduler.shutdown()
+
+    def test_submit_without_function_pulls_page(self):
+        url = "https://www.basketball-reference.com/boxscores/201710310LAL.html"
+        flexmock(utils).should_receive("_rate_limit_pq").with_args(url).and_return(
+            "page"
+        ).once()
+
+        assert self.scheduler.submit(url).result() == "page"
+
+    def test_map_returns_results_in_order(self):
+        urls = [
+            "https://www.basketball-reference.com/a.html",
+            "https://www.hockey-reference.com/b.html",
+            "https://www.basketball-reference.com/c.html",
+        ]
+
+        results = self.scheduler.map(lambda item: item * 2, [1, 2, 3], urls)
+
+        assert results == [2, 4, 6]
+
+    def test_map_accepts_single_url(self):
+        url = "https://www.basketball-reference.com/"
+
+        results = self.scheduler.map(str.upper, ["a", "b"], url)
+
+        assert results == ["A", "B"]
+
+    def test_different_hosts_run_concurrently(self):
+        # Each host only has a single worker, so the two jobs can only finish
+        # if the second host's job runs while the first host's job is waiting.
+        single = scheduler.FetchScheduler(workers_per_host=1)
+        event = threading.Event()
+        first = single.submit("https://www.basketball-reference.com/", event.wait, 5)
+        second = single.submit("https://www.hockey-reference.com/", event.set)
+
+        assert first.result() is True
+        assert second.result() is None
+        single.shutdown()
+
+    def test_same_host_shares_executor(self):
+        first = self.scheduler._executor("http://www.basketball-reference.com/a")
+        second = self.scheduler._executor("https://basketball-reference.com/b")
+        third = self.scheduler._executor("https://fbref.com/en/squads/a")
+
+        assert first is second
+        assert first is not third
+
+    def test_exceptions_are_raised_to_caller(self):
+        def fail(item):
+            raise ValueError(item)
+
+        with pytest.raises(ValueError):
+            self.scheduler.map(fail, ["bad"], "https://fbref.com/")
+
+    def test_get_scheduler_returns_shared_instance(self):
+        assert scheduler.get_scheduler() is scheduler.get_scheduler()
+
+    def test_as_completed_yields_results_as_they_finish(self):
+        # The first item is held until the second item's result has been
+        # received, so the second item's result is always yielded first.
+        release = threading.Event()
+
+        def work(item):
+            if item == "first":
+                release.wait(5)
+            return item.upper()
+
+        results = []
+        for result in self.scheduler.as_completed(
+            work, ["first", "second"], "https://www.basketball-reference.com/"
+        ):
+            results.append(result)
+            release.set()
+
+        assert results == [("second", "SECOND"), ("first", "FIRST")]
+
+    def test_as_completed_raises_exceptions_to_caller(self):
+        def fail(item):
+            raise ValueError(item)
+
+        with pytest.raises(ValueError):
+            list(self.scheduler.as_completed(fail, ["bad"], "https://fbref.com/"))
+
+    def test_nested_work_for_same_host_runs_in_worker(self):
+        # With a single worker, a job which waits on more work for the same
+        # host would block forever if the nested work was queued.
+        single = scheduler.FetchScheduler(workers_per_host=1)
+        url = "https://www.basketball-reference.com/"
+
+        def outer(item):
+            return sum(single.map(lambda value: value * item, [1, 2], url))
+
+        assert single.map(outer, [1, 10], url) == [3, 30]
+        single.shutdown()
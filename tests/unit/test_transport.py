@@ -0,0 +1,192 @@
+import pytest
+import requests
+from flexmock import flexmock
+from mock import patch
+from urllib.error import HTTPError
+from sports import rate_limiter, transport, utils
+
+
+class MockResponse:
+    def __init__(self, status_code=200, text="", headers=None):
+        self.status_code = status_code
+        self.reason = "Not Found"
+        self.headers = headers or {}
+        self.text = text
+
+
+class MockTransport:
+    def __init__(self, status_code=200, *status_codes):
+        self.status_code = status_code
+        self.status_codes = list(status_codes)
+        self.headers = {}
+        self.requests = []
+
+    def get(self, url):
+        self.requests.append(("GET", url))
+        if self.status_codes:
+            status_code = self.status_codes.pop(0)
+            return MockResponse(status_code, "<p>page</p>", self.headers)
+        return MockResponse(self.status_code, "<p>page</p>", self.headers)
+
+    def head(self, url):
+        self.requests.append(("HEAD", url))
+        return MockResponse(self.status_code)
+
+
+class TestTransport:
+    def setup_method(self):
+        self.transport = transport.Transport(timeout=5, retries=2, backoff_factor=1)
+
+    def teardown_method(self):
+        self.transport.close()
+
+    def test_session_requests_gzip(self):
+        headers = self.transport._session.headers
+
+        assert "gzip" in headers["Accept-Encoding"]
+
+    def test_adapter_only_retries_dropped_requests(self):
+        adapter = self.transport._session.get_adapter("https://fbref.com/")
+        retry = adapter.max_retries
+
+        assert retry.total == 2
+        assert retry.connect == 0
+        assert retry.status == 0
+        assert retry.backoff_factor == 1
+        assert not retry.status_forcelist
+
+    def test_same_adapter_is_used_for_every_host(self):
+        session = self.transport._session
+
+        assert session.get_adapter("http://www.hockey-reference.com/") is (
+            session.get_adapter("https://fbref.com/")
+        )
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_default_timeout_is_applied(self, mock_send):
+        adapter = self.transport._session.get_adapter("https://fbref.com/")
+
+        adapter.send("request")
+        adapter.send("request", timeout=30)
+
+        assert mock_send.call_args_list[0][1]["timeout"] == 5
+        assert mock_send.call_args_list[1][1]["timeout"] == 30
+
+    @patch("requests.Session.get", return_value=MockResponse())
+    def test_get_uses_session(self, mock_get):
+        url = "https://www.hockey-reference.com/"
+
+        self.transport.get(url)
+
+        mock_get.assert_called_once_with(url)
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_page_without_charset_uses_declared_encoding(self, mock_send):
+        response = requests.Response()
+        response.headers["Content-Type"] = "text/html"
+        response.encoding = "ISO-8859-1"
+        html = '<html><head><meta charset="utf-8"></head>Nikola Jokić</html>'
+        response._content = html.encode("utf-8")
+        mock_send.return_value = response
+
+        result = self.transport.get("https://www.basketball-reference.com/")
+
+        assert result.encoding == "utf-8"
+        assert "Nikola Jokić" in result.text
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_page_with_charset_uses_header_encoding(self, mock_send):
+        response = requests.Response()
+        response.headers["Content-Type"] = "text/html; charset=windows-1252"
+        response.encoding = "windows-1252"
+        html = '<html><head><meta charset="utf-8"></head>Théo Maledon</html>'
+        response._content = html.encode("windows-1252")
+        mock_send.return_value = response
+
+        result = self.transport.get("https://www.basketball-reference.com/")
+
+        assert result.encoding == "windows-1252"
+        assert "Théo Maledon" in result.text
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_page_without_declared_encoding_is_detected(self, mock_send):
+        response = requests.Response()
+        response.headers["Content-Type"] = "text/html"
+        response.encoding = "ISO-8859-1"
+        response._content = ("<html>Nikola Jokić " * 50 + "</html>").encode("utf-8")
+        mock_send.return_value = response
+
+        result = self.transport.get("https://www.basketball-reference.com/")
+
+        assert "Nikola Jokić" in result.text
+
+
+class TestSetTransport:
+    def setup_method(self):
+        rate_limiter.reset()
+
+    def teardown_method(self):
+        transport.set_transport(None)
+        rate_limiter.reset()
+
+    def test_get_transport_returns_shared_instance(self):
+        assert transport.get_transport() is transport.get_transport()
+
+    def test_custom_transport_is_used_for_downloads(self):
+        mock_transport = MockTransport()
+        transport.set_transport(mock_transport)
+        url = "https://www.basketball-reference.com/boxscores/201710310LAL.html"
+
+        contents = utils._download_page(url)
+
+        assert contents == "<p>page</p>"
+        assert mock_transport.requests == [("GET", url)]
+
+    def test_custom_transport_is_used_to_check_urls(self):
+        mock_transport = MockTransport(404)
+        transport.set_transport(mock_transport)
+        url = "https://www.basketball-reference.com/teams/DEN/2030.html"
+
+        assert not utils._url_exists(url)
+        assert mock_transport.requests == [("HEAD", url)]
+
+    def test_server_errors_are_retried_within_rate_limit(self):
+        mock_transport = MockTransport(200, 503, 502)
+        transport.set_transport(mock_transport)
+        flexmock(utils.time).should_receive("sleep").with_args(2).once()
+        flexmock(utils.time).should_receive("sleep").with_args(4).once()
+        flexmock(rate_limiter).should_receive("acquire").times(3)
+        url = "https://www.basketball-reference.com/boxscores/201710310LAL.html"
+
+        contents = utils._download_page(url)
+
+        assert contents == "<p>page</p>"
+        assert len(mock_transport.requests) == 3
+
+    def test_rate_limited_requests_are_retried_after_requested_wait(self):
+        mock_transport = MockTransport(200, 429)
+        transport.set_transport(mock_transport)
+        mock_transport.headers = {"Retry-After": "10"}
+        flexmock(utils.time).should_receive("sleep").with_args(10).once()
+        flexmock(rate_limiter).should_receive("acquire").times(2)
+        url = "https://www.basketball-reference.com/boxscores/201710310LAL.html"
+
+        contents = utils._download_page(url)
+
+        assert contents == "<p>page</p>"
+
+    def test_retry_after_is_limited_to_max_backoff(self):
+        response = MockResponse(503, headers={"Retry-After": "3600"})
+
+        assert utils._retry_delay(response, 0) == utils.REQUEST_MAX_BACKOFF
+
+    def test_failed_retries_raise_http_error(self):
+        mock_transport = MockTransport(429)
+        transport.set_transport(mock_transport)
+        flexmock(utils.time).should_receive("sleep")
+        url = "https://www.basketball-reference.com/boxscores/201710310LAL.html"
+
+        with pytest.raises(HTTPError):
+            utils._download_page(url)
+
+        assert len(mock_transport.requests) == utils.REQUEST_RETRIES + 1
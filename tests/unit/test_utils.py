@@ -1,8 +1,9 @@
 import pytest
 from mock import patch
+from pyquery import PyQuery as pq
 from flexmock import flexmock
-from sports import utils
-import time
+from sports import rate_limiter, utils
+from sports.constants import REQUESTS_BURST
 
 
 class SeasonStarts:
@@ -65,13 +66,30 @@ def mock_pyquery(url, *args, **kwargs):
 
 
 class TestUtils:
-    @patch("requests.get", side_effect=mock_pyquery)
+    @patch("requests.Session.get", side_effect=mock_pyquery)
     def test__rate_limit_pq(self, *args, **kwargs):
-        start = time.time()
-        url = "www.test-url.com"
+        rate_limiter.reset()
+        flexmock(rate_limiter.time).should_receive("sleep").never()
+        url = "https://www.test-url.com"
         result = utils._rate_limit_pq(url)
-        now = time.time()
-        assert now - start > 3
+
+        assert result.text() == "This is good"
+
+    @patch("requests.Session.get", side_effect=mock_pyquery)
+    def test__rate_limit_pq_waits_once_budget_is_used(self, *args, **kwargs):
+        rate_limiter.reset()
+        flexmock(rate_limiter.time).should_receive("sleep").once()
+        url = "https://www.test-url.com"
+
+        for _ in range(REQUESTS_BURST + 1):
+            utils._rate_limit_pq(url)
+
+    def test__rate_limit_pq_document_is_not_rate_limited(self):
+        flexmock(rate_limiter).should_receive("acquire").never()
+
+        result = utils._rate_limit_pq("<p>This is good</p>")
+
+        assert result.text() == "This is good"
 
     def test__find_year_for_season_returns_correct_year(self):
         season_start_matrix = [
@@ -162,6 +180,23 @@ class TestUtils:
             result = utils._find_year_for_season(month.league)
             assert result == month.expected_year
 
+    def test_page_expires_for_current_and_historical_seasons(self):
+        mock_datetime = MockDateTime(1, 2018)
+        flexmock(utils).should_receive("_todays_date").and_return(mock_datetime)
+        pages = {
+            "https://www.basketball-reference.com/boxscores/201610310LAL.html": False,
+            "https://www.basketball-reference.com/boxscores/201710310LAL.html": True,
+            "https://www.baseball-reference.com/boxes/BOS201606070.shtml": False,
+            "https://www.baseball-reference.com/boxes/BOS201806070.shtml": True,
+            "https://www.sports-reference.com/cfb/years/2016-standings.html": False,
+            "https://www.pro-football-reference.com/years/2017/week_1.htm": True,
+            "https://www.basketball-reference.com/players/h/hardeja01.html": True,
+            "https://fbref.com/en/squads/361ca564": True,
+        }
+
+        for url, expires in pages.items():
+            assert utils._page_expires(url) == expires
+
     def test_remove_html_comment_tags_removes_comments(self):
         html_string = """<html>
     <body>
@@ -276,19 +311,19 @@ class TestUtils:
 
         assert i == 2
 
-    @patch("requests.head", side_effect=mock_pyquery)
+    @patch("requests.Session.head", side_effect=mock_pyquery)
     def test_valid_url_returns_true(self, *args, **kwargs):
         response = utils._url_exists("http://www.good_url.com/this/is/valid")
 
         assert response
 
-    @patch("requests.head", side_effect=mock_pyquery)
+    @patch("requests.Session.head", side_effect=mock_pyquery)
     def test_404_url_returns_false(self, *args, **kwargs):
         response = utils._url_exists("http://www.404.com/doesnt/exist")
 
         assert not response
 
-    @patch("requests.head", side_effect=mock_pyquery)
+    @patch("requests.Session.head", side_effect=mock_pyquery)
     def test_invalid_url_exception_returns_false(self, *args, **kwargs):
         response = utils._url_exists("http://www.exception.com")
 
@@ -344,3 +379,207 @@ class TestUtils:
             secondary_index=4,
         )
         assert not result
+
+
+class TestResolveSeason:
+    def setup_method(self):
+        self.url = "https://www.basketball-reference.com/leagues/NBA_%s.html"
+        flexmock(utils).should_receive("_find_year_for_season").and_return(2018)
+        utils._resolved_seasons.clear()
+
+    def teardown_method(self):
+        utils._resolved_seasons.clear()
+
+    def test_current_season_page_is_returned(self):
+        flexmock(utils).should_receive("_rate_limit_pq").with_args(
+            self.url % 2018
+        ).and_return("2018 page").once()
+
+        year, doc = utils._resolve_season("nba", lambda season: self.url % season)
+
+        assert year == 2018
+        assert doc == "2018 page"
+
+    def test_missing_season_reverts_to_previous_season(self):
+        error = utils.HTTPError(self.url % 2018, 404, "Not Found", {}, None)
+        flexmock(utils).should_receive("_rate_limit_pq").with_args(
+            self.url % 2018
+        ).and_raise(error).once()
+        flexmock(utils).should_receive("_rate_limit_pq").with_args(
+            self.url % "2017"
+        ).and_return("2017 page").once()
+
+        year, doc = utils._resolve_season("nba", lambda season: self.url % season)
+
+        assert year == "2017"
+        assert doc == "2017 page"
+
+    def test_resolved_season_is_not_requested_again(self):
+        flexmock(utils).should_receive("_rate_limit_pq").and_return("page").once()
+
+        first = utils._resolve_season("nba", lambda season: self.url % season)
+        second = utils._resolve_season("nba", lambda season: self.url % season)
+
+        assert first == (2018, "page")
+        assert second == (2018, None)
+
+    def test_season_is_resolved_once_per_league(self):
+        error = utils.HTTPError(self.url % 2018, 404, "Not Found", {}, None)
+        flexmock(utils).should_receive("_rate_limit_pq").with_args(
+            self.url % 2018
+        ).and_raise(error).once()
+        flexmock(utils).should_receive("_rate_limit_pq").with_args(
+            self.url % "2017"
+        ).and_return("2017 page").once()
+        team_url = "https://www.basketball-reference.com/teams/DEN/%s.html"
+
+        first = utils._resolve_season("nba", lambda season: self.url % season)
+        second = utils._resolve_season("nba", lambda season: team_url % season)
+
+        assert first == ("2017", "2017 page")
+        assert second == ("2017", None)
+
+    def test_season_is_resolved_for_each_league(self):
+        flexmock(utils).should_receive("_rate_limit_pq").and_return("page").twice()
+        nhl_url = "https://www.hockey-reference.com/leagues/NHL_%s.html"
+
+        utils._resolve_season("nba", lambda season: self.url % season)
+        year, doc = utils._resolve_season("nhl", lambda season: nhl_url % season)
+
+        assert (year, doc) == (2018, "page")
+
+    def test_season_is_not_saved_when_no_page_exists(self):
+        error = utils.HTTPError(self.url, 404, "Not Found", {}, None)
+        flexmock(utils).should_receive("_rate_limit_pq").and_raise(error).times(4)
+
+        first = utils._resolve_season("nba", lambda season: self.url % season)
+        second = utils._resolve_season("nba", lambda season: self.url % season)
+
+        assert first == second == (2018, None)
+
+    def test_transport_error_is_raised_and_not_saved(self):
+        error = utils.HTTPError(self.url % 2018, 503, "Unavailable", {}, None)
+        flexmock(utils).should_receive("_rate_limit_pq").and_raise(error).twice()
+
+        for _ in range(2):
+            with pytest.raises(utils.HTTPError):
+                utils._resolve_season("nba", lambda season: self.url % season)
+
+        assert utils._resolved_seasons == {}
+
+
+class TestDataStatIndex:
+    def setup_method(self):
+        self.html = pq(
+            '<tr><th data-stat="player">Jane</th>'
+            '<td data-stat="points">12</td>'
+            '<td data-stat="assists"></td></tr>'
+            '<tr><th data-stat="player">John</th>'
+            '<td data-stat="points">8</td>'
+            '<td data-stat="assists">3</td></tr>'
+        )
+        self.scheme = {
+            "name": 'th[data-stat="player"]',
+            "first_points": 'td[data-stat="points"]:first',
+            "points": 'td[data-stat="points"]',
+            "assists": 'td[data-stat="assists"]',
+            "missing": 'td[data-stat="rebounds"]',
+            "tfoot_points": 'tfoot td[data-stat="points"]',
+        }
+
+    def test_index_groups_cells_in_document_order(self):
+        index = utils._data_stat_index(self.html)
+
+        assert index[("th", "player", None)] == ["Jane", "John"]
+        assert index[("td", "points", None)] == ["12", "8"]
+        assert index[("td", "assists", None)] == ["", "3"]
+
+    def test_index_matches_css_selection(self):
+        for field, scheme in self.scheme.items():
+            for strip in [False, True]:
+                for index in [0, 1, -1]:
+                    items = [
+                        i.text()
+                        for i in self.html(scheme).items()
+                        if i.text() or not strip
+                    ]
+                    try:
+                        expected = items[index]
+                    except IndexError:
+                        expected = None
+
+                    result = utils._parse_field(
+                        self.scheme, self.html, field, index=index, strip=strip
+                    )
+
+                    assert result == expected
+
+    def test_index_is_built_once(self):
+        utils._parse_field(self.scheme, self.html, "points")
+        flexmock(utils).should_receive("extract_text").never()
+
+        assert utils._parse_field(self.scheme, self.html, "name", 1) == "John"
+
+    def test_index_is_rebuilt_when_rows_are_added(self):
+        utils._parse_field(self.scheme, self.html, "points")
+
+        self.html += pq('<tr><td data-stat="points">20</td></tr>')
+
+        assert utils._parse_field(self.scheme, self.html, "points", 2) == "20"
+
+    def test_first_matches_first_cell_of_every_row(self):
+        rows = pq(
+            "<table>"
+            '<tr><td data-stat="BB">458</td><td data-stat="BB">1</td></tr>'
+            '<tr><td data-stat="BB">517</td><td data-stat="BB">2</td></tr>'
+            "</table>"
+        )("tr")
+        scheme = {"walks": 'td[data-stat="BB"]:first'}
+        expected = [i.text() for i in rows(scheme["walks"]).items()]
+
+        walks = [utils._parse_field(scheme, rows, "walks", i) for i in [0, 1]]
+
+        assert expected == ["458", "517"]
+        assert walks == expected
+
+
+class TestCommentRemoval:
+    def setup_method(self):
+        self.contents = (
+            "<html><body><div id='all_stats'><!--"
+            "<table id='stats'><tbody><tr><td>1</td></tr></tbody></table>"
+            "--></div></body></html>"
+        )
+
+    def test_parsed_page_has_comments_removed(self):
+        doc = utils._parse_page(self.contents)
+
+        assert doc._comments_removed
+        assert doc("table#stats td").text() == "1"
+
+    def test_uncommented_page_returns_parsed_page(self):
+        doc = utils._parse_page(self.contents)
+        flexmock(utils).should_receive("_remove_html_comment_tags").never()
+
+        assert utils._uncommented_page(doc) is doc
+
+    def test_uncommented_page_removes_comments_from_other_pages(self):
+        doc = pq(self.contents, parser="html")
+
+        result = utils._uncommented_page(doc)
+
+        assert result._comments_removed
+        assert result("table#stats td").text() == "1"
+
+    def test_stats_table_is_not_parsed_again(self):
+        doc = utils._parse_page(self.contents)
+        flexmock(utils).should_receive("_remove_html_comment_tags").never()
+
+        rows = list(utils._get_stats_table(doc, "table#stats"))
+
+        assert len(rows) == 1
+
+    def test_missing_stats_table_returns_none(self):
+        doc = utils._parse_page(self.contents)
+
+        assert utils._get_stats_table(doc, "table#missing") is None